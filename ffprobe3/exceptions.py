@@ -110,7 +110,9 @@ class FFprobePopenError(FFprobeError):
 
 
 class FFprobeJsonParseError(FFprobeError):
-    """This wraps an exception that was raised by function ``json.loads``.
+    """This wraps an exception that was raised by the JSON parser
+    (function ``orjson.loads`` if installed; else function ``json.loads``;
+    or function ``ijson.items``, when called by ``probe_streaming``).
 
     Args:
         exc (caught exception): the exception instance that was raised
@@ -121,7 +123,7 @@ class FFprobeJsonParseError(FFprobeError):
         self.caught_type_name = caught_type_name
 
     def __str__(self):
-        return "Function 'json.loads' raised exception %s (caught as %s): %s" % \
+        return "JSON parser raised exception %s (caught as %s): %s" % \
                 (_get_full_qualname(self.exc), self.caught_type_name, str(self.exc))
 
 
@@ -143,6 +145,26 @@ class FFprobeSubprocessError(FFprobeError):
                 (self.split_cmdline, self.exit_status, self.stderr)
 
 
+class FFprobeTimeoutError(FFprobeSubprocessError):
+    """The ffprobe subprocess did not finish before the timeout expired.
+
+    The subprocess has been killed.  This is a derived class of
+    :class:`FFprobeSubprocessError`; its `exit_status` is always ``None``.
+
+    Args:
+        split_cmdline (list of strings): the command-line that was executed
+        timeout (float): the timeout in seconds that expired
+        stderr (file, optional): the message printed to stderr
+    """
+    def __init__(self, split_cmdline, timeout, stderr=None):
+        super().__init__(split_cmdline, None, stderr)
+        self.timeout = timeout
+
+    def __str__(self):
+        return "Subprocess %s timed out after %s seconds: %s" % \
+                (self.split_cmdline, self.timeout, self.stderr)
+
+
 class FFprobeStreamSubclassError(FFprobeError):
     """The wrong stream subclass has been constructed for a codec type.
 
@@ -32,6 +32,11 @@ Noteworthy improvements in this fork include:
 - All ffprobe-output classes can be reconstructed from their JSON ``repr()``.
 - Added several derived exception classes for more-informative error reporting.
 - Re-wrote the subprocess code to use convenient new Python3 library features.
+- Parse the JSON output using the faster ``orjson`` package, if it's installed.
+- Cache the output of ``ffprobe`` for repeated probes of unchanged local files.
+- Probe many media files concurrently (``probe_many``, ``probe_async``).
+- Collect numeric fields of many media files into columns (``probe_bulk``).
+- Yield each stream while ``ffprobe`` is running, using ``ijson`` if installed.
 - Documented the API (Sphinx/reST docstrings for modules, classes, methods).
 
 These are the currently-implemented classes to wrap ffprobe JSON output:
@@ -48,7 +53,7 @@ These are the currently-implemented classes to wrap ffprobe JSON output:
 Significant API-breaking changes in this fork include:
 
 - **Changed the client-facing API of functions & classes**.
-- **No longer support Python 2 or Python3 < 3.3**.
+- **No longer support Python 2 or Python3 < 3.7**.
 
 Read the updated ``README.md`` file for a longer list of changes & reasons.
 
@@ -160,18 +165,95 @@ exceptions in the `ffprobe3` class & function API, also look at test module
 `tests/test_ffprobe3.py <https://github.com/jboy/ffprobe3-python3/blob/master/tests/test_ffprobe3.py>`_ (link into GitHub repo).
 """
 
+import array
+import asyncio
+import functools
 import json
+import math
 import os
 import re
+import signal
+import stat
 import subprocess
+import tempfile
+import threading
 
 from collections.abc import Mapping
 from .exceptions import *
 
-
-# A list, so you can modify the command-line arguments if you really insist.
-# Don't shoot yourself in the foot!
-_SPLIT_COMMAND_LINE = [
+# If the optional `orjson` package is installed, use it to parse the JSON
+# output of `ffprobe`:  It's significantly faster than the standard-library
+# `json` module, and it parses the raw `bytes` directly (no decode step).
+# It returns plain ``dict`` & ``list`` instances, just like `json.loads`.
+#  https://pypi.org/project/orjson/
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# If the optional `pysimdjson` package is installed, it may be used (on request)
+# to parse the JSON output of `ffprobe` lazily:  It returns read-only proxies
+# that only decode the keys & values that are actually accessed.
+#  https://pypi.org/project/pysimdjson/
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+else:
+    # Ensure that the lazy proxies will be accepted by `ParsedJson`.
+    Mapping.register(simdjson.Object)
+
+# If the optional `ijson` package is installed, function `probe_streaming`
+# will use it to parse each stream in the JSON output of `ffprobe` as soon as
+# that stream has been printed, rather than waiting for `ffprobe` to finish.
+#  https://pypi.org/project/ijson/
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# If the optional `numpy` package is installed, function `probe_bulk` will
+# return its columns of numbers as numpy arrays (rather than `array.array`).
+#  https://pypi.org/project/numpy/
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# The unit prefixes for data-sizes, in increasing order of magnitude.
+_SI_PREFIXES = ('', 'k', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y')
+# The same unit prefixes for base-2 data-sizes (e.g., 'ki', 'Mi', etc.).
+_BINARY_PREFIXES = ('',) + tuple('%si' % prefix for prefix in _SI_PREFIXES[1:])
+
+# The `ffprobe` input name to read the media from stdin.
+_STDIN_MEDIA_FILENAME = 'pipe:0'
+
+# On POSIX, each `ffprobe` subprocess is started in a new process group, so
+# that if its timeout expires, we can also kill any processes it spawned.
+_KILL_PROCESS_GROUP = (os.name == 'posix')
+
+# Seconds to wait after SIGTERM before sending SIGKILL to the process group.
+_KILL_GRACE_PERIOD_SECS = 1.0
+
+# Names (& name prefixes) of methods in class `ParsedJson` & its derived
+# classes, which are excluded by method `ParsedJson.list_attr_names`.
+_NON_ATTR_NAME_PREFIXES = ("_", "get", "is_", "list_")
+_NON_ATTR_NAMES = frozenset(("keys", "items", "values"))
+
+# Match a frame-rate ratio `"int/int"` (e.g., `"2997/100"`), capturing the
+# numerator & denominator.  The regex is compiled once at import, and its
+# `match` method is bound here, to avoid per-call lookups in the `re` cache.
+_FRAME_RATE_RATIO_MATCH = re.compile("^(-?[0-9]+)/(-?[0-9]+)$").match
+
+# The numeric fields returned (as columns) by function `probe_bulk`.
+_BULK_PROBE_FIELDS = ('duration', 'bit_rate',
+        'width', 'height', 'nb_frames', 'sample_rate')
+
+# A tuple, so each call to `probe` can build its own command-line list with
+# a single concatenation.  You can still replace the whole tuple if you really
+# insist on modifying the command-line arguments.  Don't shoot yourself in the foot!
+_SPLIT_COMMAND_LINE = (
         'ffprobe',
         '-v',
         # Use a log-level ('-v') of 'error' rather than 'quiet',
@@ -183,17 +265,20 @@ _SPLIT_COMMAND_LINE = [
         '-show_chapters',
         '-show_format',
         '-show_streams',
-]
-
-# Match anything that looks like a URI Scheme to specify a remote media stream:
-#  https://en.wikipedia.org/wiki/Uniform_Resource_Identifier#Syntax
-#  https://en.wikipedia.org/wiki/List_of_URI_schemes
-_URI_SCHEME = re.compile("^[a-z][a-z0-9-]*://")
+)
 
 
 def probe(media_filename, *,
         communicate_timeout=10.0,  # a timeout in seconds
         ffprobe_cmd_override=None,
+        lazy_json=False,
+        read_interval=None,  # a duration in seconds
+        analyze_duration_us=None,  # a duration in microseconds
+        probe_size=None,  # a size in Bytes
+        input_bytes=None,
+        capture_stderr=True,
+        use_cache=True,
+        retain_json=True,
         verify_local_mediafile=True):
     """
     Wrap the ``ffprobe`` command, requesting the ``json`` print-format.
@@ -208,10 +293,27 @@ def probe(media_filename, *,
     Args:
         media_filename (str):
             filename of local media or URI of remote media to probe
+            (or ``None``, if the media is supplied in `input_bytes`)
         communicate_timeout (positive float, optional):
-            a timeout in seconds for ``subprocess.Popen.communicate``
+            a timeout in seconds for the ``ffprobe`` subprocess
         ffprobe_cmd_override (str, optional):
             file-path of a command to invoke instead of default ``"ffprobe"``
+        lazy_json (bool, optional):
+            parse the JSON lazily using ``simdjson`` (if it's installed)
+        read_interval (positive float, optional):
+            only read this many seconds from the start of the media
+        analyze_duration_us (positive int, optional):
+            maximum microseconds of media for ``ffprobe`` to analyze
+        probe_size (positive int, optional):
+            maximum Bytes of media for ``ffprobe`` to read to detect streams
+        input_bytes (bytes, optional):
+            media data for ``ffprobe`` to read from stdin, instead of a file
+        capture_stderr (bool, optional):
+            capture the stderr of ``ffprobe`` (see the note below)
+        use_cache (bool, optional):
+            re-use cached ``ffprobe`` output for a local file (see the note below)
+        retain_json (bool, optional):
+            retain the parsed JSON in the returned instances (see the note below)
         verify_local_mediafile (bool, optional):
             verify `media_filename` exists, if it's a local file (sanity check)
 
@@ -221,12 +323,13 @@ def probe(media_filename, *,
     Raises:
         FFprobeError: the base class of all exception classes in this package
         FFprobeExecutableError: ffprobe command not found in ``$PATH``
-        FFprobeInvalidArgumentError: invalid value to `communicate_timeout`
+        FFprobeInvalidArgumentError: invalid value to an argument
         FFprobeJsonParseError: JSON parser was unable to parse ffprobe output
         FFprobeMediaFileError: specified local media file does not exist
         FFprobeOverrideFileError: `ffprobe_cmd_override` file not found
         FFprobePopenError: ``subprocess.Popen`` failed, raised an exception
         FFprobeSubprocessError: ffprobe command returned non-zero exit status
+        FFprobeTimeoutError: ffprobe command did not finish before timeout
 
     **Note:** If parameter `ffprobe_cmd_override` receives a non-``None``
     argument, it must be a string that specifies the full file-path (either
@@ -248,6 +351,63 @@ def probe(media_filename, *,
     to the ``ffprobe`` command on their own system); and (b) searching for an
     executable in ``$PATH`` is what ``subprocess.Popen`` does *by default*.)
 
+    **Note:** If parameter `lazy_json` is true, and the optional ``pysimdjson``
+    package is installed, the JSON output of ``ffprobe`` will be parsed lazily:
+    The ``.parsed_json`` attribute of each :class:`ParsedJson` instance will be
+    a read-only ``simdjson.Object`` proxy rather than a ``dict``, which only
+    decodes the keys & values that are actually accessed.  This is faster if
+    your code only examines a few attributes of the media.  (If ``pysimdjson``
+    is not installed, `lazy_json` is ignored.)  Note that each lookup of a
+    nested JSON object via a lazy proxy returns a *new* proxy instance.
+
+    **Note:** The output of ``ffprobe`` for a local media file is cached
+    (for the most-recent 256 distinct probes), keyed by the command-line and
+    the file's identity, size & modification-time.  So repeated probes of an
+    unchanged local file will not re-run ``ffprobe``; but each call will still
+    return a new instance of class :class:`FFprobe`.  Output for remote media
+    is never cached.  To discard all cached output, call
+    ``probe.cache_clear()``.
+    If parameter `use_cache` is false, ``ffprobe`` will always be run (and
+    its output will not be cached), e.g., if the file might be modified
+    again within the resolution of its file-system's modification-time.
+
+    **Note:** By default, ``ffprobe`` may read & analyze a lot of the media
+    (or even all of it) to determine accurate metadata.  For large local files
+    or slow remote streams, parameters `read_interval`, `analyze_duration_us`
+    & `probe_size` will limit how much of the media is read (by passing the
+    ``-read_intervals``, ``-analyzeduration`` & ``-probesize`` options to
+    ``ffprobe``), which can make a probe *much* faster.  The trade-off is that
+    metadata such as the duration, bit-rate & number of frames may be missing
+    or less accurate.  If these parameters are ``None`` (the default), the
+    corresponding options are not passed to ``ffprobe``.
+
+    **Note:** If parameter `input_bytes` receives a non-``None`` argument
+    (such as the ``bytes`` of an HTTP response that's already in memory),
+    ``ffprobe`` will read the media from its stdin (as input ``"pipe:0"``)
+    rather than opening a file.  In this case, `media_filename` should be
+    ``None`` (or ``"pipe:0"``); `verify_local_mediafile` is ignored; and the
+    output of ``ffprobe`` is not cached.  Note that when ``ffprobe`` reads
+    from a pipe, it can't seek within the media, so some metadata (such as
+    the duration of some container formats) may be missing.
+
+    **Note:** By default, the stderr of ``ffprobe`` is captured, to report in
+    an exception if ``ffprobe`` fails.  But a successful ``ffprobe`` prints
+    nothing to stderr (at the ``error`` log-level), so if parameter
+    `capture_stderr` is false, stderr will be discarded instead, avoiding
+    the overhead of a second pipe.  In this case, if ``ffprobe`` returns a
+    non-zero exit status, ``ffprobe`` will be run again (with stderr captured)
+    to obtain the error message for the exception.  (A timeout is not re-run.)
+
+    **Note:** By default, every instance of :class:`ParsedJson` in the returned
+    tree retains its parsed JSON, which can be large (e.g., nested ``"tags"``
+    & ``"disposition"`` dictionaries for every stream).  If parameter
+    `retain_json` is false, the parsed JSON will be discarded after the data
+    attributes have been extracted, to reduce memory usage when probing many
+    media files:  The data attributes (including the ``chapters`` & stream
+    lists) are unaffected; but the ``.parsed_json`` attribute of every instance
+    will be an empty ``dict``, so key look-ups & getter methods will return
+    their defaults, and ``repr()`` will no longer reconstruct the instance.
+
     Example usage of this function::
 
         import ffprobe3
@@ -259,26 +419,455 @@ def probe(media_filename, *,
         ffprobe_output = ffprobe3.probe('http://some-streaming-url.com:8080/stream')
     """
 
-    split_cmdline = list(_SPLIT_COMMAND_LINE)  # Roger, copy that.
-    ffprobe_cmd = split_cmdline[0]
+    (split_cmdline, local_file_stat) = _build_split_cmdline(media_filename,
+            communicate_timeout=communicate_timeout,
+            ffprobe_cmd_override=ffprobe_cmd_override,
+            read_interval=read_interval,
+            analyze_duration_us=analyze_duration_us,
+            probe_size=probe_size,
+            input_bytes=input_bytes,
+            verify_local_mediafile=verify_local_mediafile)
+
+    # Re-use the output of a previous `ffprobe` run (if any) for the same
+    # local media file, command-line & timeout; as long as the file's size
+    # & modification-time (& identity on the file-system) are unchanged.
+    # The cached output is the `bytes` printed by `ffprobe` (rather than the
+    # parsed JSON), so each call will still return a new, independent tree
+    # of `ParsedJson` instances.
+    if local_file_stat is None or not use_cache:
+        outs = _run_ffprobe(split_cmdline, communicate_timeout, input_bytes,
+                capture_stderr)
+    else:
+        outs = _run_ffprobe_cached(tuple(split_cmdline),
+                (local_file_stat.st_dev, local_file_stat.st_ino),
+                local_file_stat.st_size, local_file_stat.st_mtime_ns,
+                communicate_timeout, capture_stderr)
+
+    parsed_json = _parse_json_output(outs, lazy_json=lazy_json)
+    ffprobe_output = FFprobe._from_probe(split_cmdline, parsed_json)
+    if not retain_json:
+        ffprobe_output._discard_parsed_json()
+    return ffprobe_output
+
+
+async def probe_async(media_filename, *,
+        communicate_timeout=10.0,  # a timeout in seconds
+        ffprobe_cmd_override=None,
+        lazy_json=False,
+        read_interval=None,  # a duration in seconds
+        analyze_duration_us=None,  # a duration in microseconds
+        probe_size=None,  # a size in Bytes
+        input_bytes=None,
+        capture_stderr=True,
+        use_cache=True,
+        retain_json=True,
+        verify_local_mediafile=True):
+    """Wrap the ``ffprobe`` command, requesting the ``json`` print-format.
 
-    if ffprobe_cmd_override is not None:
-        if not os.path.isfile(ffprobe_cmd_override):
-            raise FFprobeOverrideFileError(ffprobe_cmd_override)
-        else:
-            ffprobe_cmd = ffprobe_cmd_override
-            split_cmdline[0] = ffprobe_cmd_override
+    This is an ``asyncio`` coroutine version of function :func:`probe`,
+    with the same parameters & return value, and the same exceptions.
+    The ``ffprobe`` subprocess is run using ``asyncio``, so the event loop
+    is not blocked while waiting for ``ffprobe`` to finish.
+
+    Example usage of this function::
+
+        import asyncio
+        import ffprobe3
+
+        async def main(media_filenames):
+            return await asyncio.gather(
+                    *[ffprobe3.probe_async(f) for f in media_filenames])
+
+    **Note:** Unlike function :func:`probe`, the output of ``ffprobe`` is
+    never cached by this function.  (Parameter `use_cache` is accepted, so
+    that the same keyword arguments may be passed to both functions, but
+    it's ignored.)
+
+    Returns:
+        a new instance of class :class:`FFprobe`
+    """
+    (split_cmdline, parsed_json) = await _probe_json_async(media_filename,
+            communicate_timeout=communicate_timeout,
+            ffprobe_cmd_override=ffprobe_cmd_override,
+            lazy_json=lazy_json,
+            read_interval=read_interval,
+            analyze_duration_us=analyze_duration_us,
+            probe_size=probe_size,
+            input_bytes=input_bytes,
+            capture_stderr=capture_stderr,
+            verify_local_mediafile=verify_local_mediafile)
+    ffprobe_output = FFprobe._from_probe(split_cmdline, parsed_json)
+    if not retain_json:
+        ffprobe_output._discard_parsed_json()
+    return ffprobe_output
+
+
+async def _probe_json_async(media_filename, *,
+        communicate_timeout=10.0,
+        ffprobe_cmd_override=None,
+        lazy_json=False,
+        read_interval=None,
+        analyze_duration_us=None,
+        probe_size=None,
+        input_bytes=None,
+        capture_stderr=True,
+        verify_local_mediafile=True):
+    """Run ``ffprobe`` for :func:`probe_async` & :func:`probe_bulk`.
+
+    Returns:
+        a pair ``(split_cmdline, parsed_json)``
+    """
+    (split_cmdline, _) = _build_split_cmdline(media_filename,
+            communicate_timeout=communicate_timeout,
+            ffprobe_cmd_override=ffprobe_cmd_override,
+            read_interval=read_interval,
+            analyze_duration_us=analyze_duration_us,
+            probe_size=probe_size,
+            input_bytes=input_bytes,
+            verify_local_mediafile=verify_local_mediafile)
+
+    outs = await _run_ffprobe_async(split_cmdline, communicate_timeout,
+            input_bytes, capture_stderr)
+    return (split_cmdline, _parse_json_output(outs, lazy_json=lazy_json))
+
+
+def probe_many(media_filenames, *, concurrency=8, return_exceptions=False,
+        **kwargs):
+    """Probe multiple media files or streams, with concurrent ``ffprobe`` runs.
+
+    Almost all of the time taken by function :func:`probe` is spent waiting
+    for the ``ffprobe`` subprocess to finish.  So to probe many media files
+    (e.g., a whole directory tree), this function runs up to `concurrency`
+    ``ffprobe`` subprocesses at once (using :func:`probe_async`).
+
+    Any other keyword arguments (such as `communicate_timeout`) will be
+    passed through to :func:`probe_async` for every media file.
+
+    Args:
+        media_filenames (iterable of str):
+            filenames of local media or URIs of remote media to probe
+        concurrency (positive int, optional):
+            maximum number of ``ffprobe`` subprocesses to run at once
+        return_exceptions (bool, optional):
+            return the exception of each failed probe, rather than raising
+
+    Returns:
+        a list of new instances of class :class:`FFprobe`,
+        in the same order as `media_filenames`
+        (or if `return_exceptions` is true, an exception instance
+        in place of each probe that failed)
+
+    Raises:
+        FFprobeError: the exception raised by the first probe that failed
+        (unless `return_exceptions` is true)
+
+    **Note:** This function calls ``asyncio.run()`` to run a new event loop,
+    so it can't be called by a coroutine that's running in an event loop.
+    Instead, a coroutine should ``await`` :func:`probe_async` directly.
+    """
+    _verify_positive_number('concurrency', concurrency,
+            'concurrency', int)
+    return asyncio.run(_gather_probes(probe_async, list(media_filenames),
+            concurrency, kwargs, return_exceptions=return_exceptions))
 
-    if communicate_timeout is not None:
-        # Verify that this non-None value is some kind of positive number.
-        if not isinstance(communicate_timeout, (int, float)):
-            raise FFprobeInvalidArgumentError('communicate_timeout',
-                    'Supplied timeout is non-None and non-numeric',
-                    communicate_timeout)
-        if communicate_timeout <= 0.0:
-            raise FFprobeInvalidArgumentError('communicate_timeout',
-                    'Supplied timeout is non-None and non-positive',
-                    communicate_timeout)
+
+def probe_bulk(media_filenames, *, concurrency=8,
+        communicate_timeout=10.0,  # a timeout in seconds
+        ffprobe_cmd_override=None,
+        lazy_json=False,
+        read_interval=None,  # a duration in seconds
+        analyze_duration_us=None,  # a duration in microseconds
+        probe_size=None,  # a size in Bytes
+        capture_stderr=True,
+        verify_local_mediafile=True):
+    """Probe multiple media files or streams, returning columns of numbers.
+
+    This is a leaner alternative to function :func:`probe_many`, for batches
+    of thousands of media files, when only a few numeric fields are needed:
+    No :class:`FFprobe` (or other ffprobe-output class) instances are
+    constructed; instead, each of these numeric fields is collected into
+    its own column (one element per media file, as ``float``):
+
+    - ``"duration"``: the format duration in seconds
+    - ``"bit_rate"``: the format bit-rate in bits/second
+    - ``"width"``: the frame width in pixels of the first video stream
+    - ``"height"``: the frame height in pixels of the first video stream
+    - ``"nb_frames"``: the number of frames of the first video stream
+    - ``"sample_rate"``: the sample rate in Hz of the first audio stream
+
+    If a field is not found in the JSON (e.g., no video stream at all),
+    the element of the column for that media file is ``nan``.
+
+    If the optional ``numpy`` package is installed, each column is a
+    ``numpy.ndarray`` of dtype ``float64``; otherwise, each column is an
+    ``array.array`` of typecode ``'d'``.
+
+    The ``ffprobe`` subprocesses are run concurrently, exactly as for
+    function :func:`probe_many`.  The other parameters are the same as for
+    function :func:`probe` (other than `input_bytes`, `use_cache` &
+    `retain_json`, which are not applicable), and will be used for every
+    media file.
+
+    Args:
+        media_filenames (iterable of str):
+            filenames of local media or URIs of remote media to probe
+        concurrency (positive int, optional):
+            maximum number of ``ffprobe`` subprocesses to run at once
+
+    Returns:
+        a new ``dict`` that maps each field name (above) to its column,
+        in the same order as `media_filenames`
+
+    Raises:
+        FFprobeError: the exception raised by the first probe that failed
+    """
+    _verify_positive_number('concurrency', concurrency,
+            'concurrency', int)
+    kwargs = dict(communicate_timeout=communicate_timeout,
+            ffprobe_cmd_override=ffprobe_cmd_override,
+            lazy_json=lazy_json,
+            read_interval=read_interval,
+            analyze_duration_us=analyze_duration_us,
+            probe_size=probe_size,
+            capture_stderr=capture_stderr,
+            verify_local_mediafile=verify_local_mediafile)
+    results = asyncio.run(_gather_probes(_probe_json_async,
+            list(media_filenames), concurrency, kwargs))
+
+    nan = math.nan
+    columns = {name: array.array('d', (nan,)) * len(results)
+            for name in _BULK_PROBE_FIELDS}
+    durations =     columns['duration']
+    bit_rates =     columns['bit_rate']
+    widths =        columns['width']
+    heights =       columns['height']
+    nbs_frames =    columns['nb_frames']
+    sample_rates =  columns['sample_rate']
+
+    for (i, (_, parsed_json)) in enumerate(results):
+        format_json = parsed_json.get('format', {})
+        durations[i] = _to_float(format_json.get('duration'), nan)
+        bit_rates[i] = _to_float(format_json.get('bit_rate'), nan)
+
+        # Find the first video stream & the first audio stream.
+        video_json = None
+        audio_json = None
+        for stream_json in parsed_json.get('streams', []):
+            codec_type = stream_json.get('codec_type')
+            if codec_type == 'video' and video_json is None:
+                video_json = stream_json
+            elif codec_type == 'audio' and audio_json is None:
+                audio_json = stream_json
+        if video_json is not None:
+            widths[i] = _to_float(video_json.get('width'), nan)
+            heights[i] = _to_float(video_json.get('height'), nan)
+            nbs_frames[i] = _to_float(video_json.get('nb_frames'), nan)
+        if audio_json is not None:
+            sample_rates[i] = _to_float(audio_json.get('sample_rate'), nan)
+
+    if numpy is not None:
+        # Wrap (rather than copy) the contents of each `array.array`.
+        return {name: numpy.frombuffer(column, dtype=numpy.float64)
+                for (name, column) in columns.items()}
+    return columns
+
+
+async def _gather_probes(probe_coro, media_filenames, concurrency, kwargs, *,
+        return_exceptions=False):
+    """Gather `probe_coro` of `media_filenames` for :func:`probe_many` etc.
+    """
+    # The semaphore must be created inside the running event loop.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _probe_one(media_filename):
+        async with semaphore:
+            return await probe_coro(media_filename, **kwargs)
+
+    # We don't let the first exception cancel the other probes:  Cancelling
+    # a task during `asyncio.create_subprocess_exec` can leave the event loop
+    # waiting forever for the new child process.  Instead, we wait for every
+    # probe to finish, then raise the exception of the first failed probe.
+    results = await asyncio.gather(*[_probe_one(f) for f in media_filenames],
+            return_exceptions=True)
+    for result in results:
+        # Never return (say) `KeyboardInterrupt` or `CancelledError`.
+        if isinstance(result, BaseException) and \
+                not (return_exceptions and isinstance(result, Exception)):
+            raise result
+    return results
+
+
+def probe_streaming(media_filename, *,
+        communicate_timeout=10.0,  # a timeout in seconds
+        ffprobe_cmd_override=None,
+        read_interval=None,  # a duration in seconds
+        analyze_duration_us=None,  # a duration in microseconds
+        probe_size=None,  # a size in Bytes
+        verify_local_mediafile=True):
+    """Probe the media with ``ffprobe``, yielding each stream as it's parsed.
+
+    This is a generator version of function :func:`probe`, for media with
+    very many streams (such as concatenated archives), which can make the
+    JSON output of ``ffprobe`` megabytes long.  It yields an instance of
+    class :class:`FFstream` (or an appropriate derived class) for each
+    stream, in the same order as attribute ``FFprobe.streams``.
+
+    The parameters are the same as for function :func:`probe` (other than
+    `lazy_json`, `input_bytes` & `capture_stderr`), as are the exceptions
+    that may be raised.
+
+    If the optional ``ijson`` package is installed, the JSON output of
+    ``ffprobe`` will be parsed incrementally while ``ffprobe`` is running,
+    so each stream is yielded as soon as it has been printed by ``ffprobe``;
+    and the complete tree of parsed JSON is never built in memory.  If the
+    ``ijson`` package is not installed, this generator simply calls function
+    :func:`probe` and then yields each stream from the result.
+
+    Example usage of this function::
+
+        import ffprobe3
+
+        for stream in ffprobe3.probe_streaming('media-file.mkv'):
+            if stream.is_video():
+                print(stream.get_frame_shape())
+
+    **Note:** This generator only yields streams; if you also want the
+    format or chapters of the media, call function :func:`probe` instead.
+    The output of ``ffprobe`` is never cached by this generator.
+
+    **Note:** If an exception is raised by ``ffprobe`` (e.g., a non-zero
+    exit status), it will be raised *after* any streams that were already
+    parsed have been yielded.
+
+    Yields:
+        a new instance of class :class:`FFstream` (or a derived class)
+    """
+    if ijson is None:
+        # Don't cache (or re-use a cached) output; and pass the parameters that
+        # this generator doesn't accept explicitly, rather than relying upon
+        # the defaults of function `probe`.
+        ffprobe_output = probe(media_filename,
+                communicate_timeout=communicate_timeout,
+                ffprobe_cmd_override=ffprobe_cmd_override,
+                lazy_json=False,
+                read_interval=read_interval,
+                analyze_duration_us=analyze_duration_us,
+                probe_size=probe_size,
+                input_bytes=None,
+                capture_stderr=True,
+                use_cache=False,
+                verify_local_mediafile=verify_local_mediafile)
+        yield from ffprobe_output.streams
+        return
+
+    (split_cmdline, _) = _build_split_cmdline(media_filename,
+            communicate_timeout=communicate_timeout,
+            ffprobe_cmd_override=ffprobe_cmd_override,
+            read_interval=read_interval,
+            analyze_duration_us=analyze_duration_us,
+            probe_size=probe_size,
+            input_bytes=None,
+            verify_local_mediafile=verify_local_mediafile)
+
+    # The stderr of `ffprobe` is written to a temporary file rather than a
+    # pipe, because we won't read it until `ffprobe` has finished:  If it were
+    # a pipe, `ffprobe` could block forever when the pipe buffer fills up.
+    with tempfile.TemporaryFile() as errs_file:
+        proc = _popen_ffprobe(split_cmdline,
+                stdout=subprocess.PIPE, stderr=errs_file)
+
+        # Kill `ffprobe` if it doesn't finish before the timeout expires.
+        timed_out = threading.Event()
+        def _kill_on_timeout():
+            timed_out.set()
+            _kill_ffprobe(proc)
+        timer = threading.Timer(communicate_timeout, _kill_on_timeout)
+        timer.daemon = True
+        timer.start()
+
+        try:
+            parse_exc = None
+            try:
+                # In the JSON output of `ffprobe`, the "streams" are printed
+                # before the "chapters" & the "format".
+                for stream in ijson.items(proc.stdout, 'streams.item',
+                        use_float=True):
+                    yield _construct_ffstream_subclass(stream)
+            except ijson.JSONError as e:
+                # If `ffprobe` failed, its output will be incomplete JSON.
+                # So first check whether `ffprobe` failed, before we report
+                # this exception.
+                parse_exc = e
+
+            exit_status = proc.wait()
+            timer.cancel()
+            errs_file.seek(0)
+            errs = errs_file.read()
+            if timed_out.is_set():
+                raise FFprobeTimeoutError(split_cmdline, communicate_timeout,
+                        _decode_stderr(errs))
+            _check_exit_status(split_cmdline, exit_status, errs)
+            if parse_exc is not None:
+                raise FFprobeJsonParseError(parse_exc,
+                        'ijson.JSONError') from parse_exc
+        finally:
+            # If the caller stopped iterating early (or an exception was
+            # raised), don't leave `ffprobe` running.
+            timer.cancel()
+            if proc.poll() is None:
+                _kill_ffprobe(proc)
+                proc.wait()
+            proc.stdout.close()
+
+
+def _build_split_cmdline(media_filename, *,
+        communicate_timeout,
+        ffprobe_cmd_override,
+        read_interval,
+        analyze_duration_us,
+        probe_size,
+        input_bytes,
+        verify_local_mediafile):
+    """Validate the arguments & build the ``ffprobe`` command-line to run.
+
+    This is shared by functions :func:`probe`, :func:`probe_async` &
+    :func:`probe_streaming`, which accept the same keyword arguments.
+
+    Returns:
+        a 2-tuple of: a new list of strings, the split command-line to run;
+        and the ``os.stat_result`` of the local media file (or ``None`` if
+        the media is not a local file)
+    """
+    if ffprobe_cmd_override is not None and \
+            not os.path.isfile(ffprobe_cmd_override):
+        raise FFprobeOverrideFileError(ffprobe_cmd_override)
+    ffprobe_cmd = ffprobe_cmd_override or _SPLIT_COMMAND_LINE[0]
+
+    _verify_positive_number('communicate_timeout', communicate_timeout,
+            'timeout', (int, float))
+    _verify_positive_number('read_interval', read_interval,
+            'read interval', (int, float))
+    _verify_positive_number('analyze_duration_us', analyze_duration_us,
+            'analyze duration', int)
+    _verify_positive_number('probe_size', probe_size,
+            'probe size', int)
+
+    if input_bytes is not None:
+        # The media will be read by `ffprobe` from its stdin, not a file.
+        if media_filename is not None and \
+                media_filename != _STDIN_MEDIA_FILENAME:
+            raise FFprobeInvalidArgumentError('media_filename',
+                    'Supplied media filename must be None or "%s" '
+                    'if input_bytes is non-None' % _STDIN_MEDIA_FILENAME,
+                    media_filename)
+        media_filename = _STDIN_MEDIA_FILENAME
+        verify_local_mediafile = False
+        local_file_stat = None
+    else:
+        # A single `os.stat` both verifies that a local media file exists
+        # (below) and provides the file's size & modification-time (for
+        # the cache key of the `ffprobe` output in function `probe`).
+        local_file_stat = _stat_local_mediafile(media_filename)
 
     # Verify that the specified media exists (if it's a local file).
     # We perform this by default as a helpful (but optional!) sanity check.
@@ -300,23 +889,11 @@ def probe(media_filename, *,
     # (e.g., over HTTP)...  The previous version of `ffprobe-python` did that,
     # and it was reported as an issue (which is still Open):
     #  https://github.com/gbstack/ffprobe-python/issues/4
-    if verify_local_mediafile:
-        # How do we detect when the media file is remote rather than local?
-        # If you run `ffprobe -protocols`, it prints the file protocols that
-        # it supports.  On my system, that list (joined at newlines) is:
-        #
-        #       Input: async bluray cache concat crypto data file ftp gopher
-        #       hls http httpproxy https mmsh mmst pipe rtp sctp srtp subfile
-        #       tcp tls udp udplite unix rtmp rtmpe rtmps rtmpt rtmpte sftp
-        #
-        # But rather than hard-coding a list of protocols, let's just match
-        # anything that *looks* like a URI Scheme:
-        #  https://en.wikipedia.org/wiki/Uniform_Resource_Identifier#Syntax
-        #  https://en.wikipedia.org/wiki/List_of_URI_schemes
-        if _URI_SCHEME.match(media_filename) is None:
-            # It doesn't look like the URI of a remote media file.
-            if not os.path.isfile(media_filename):
-                raise FFprobeMediaFileError(media_filename)
+    if verify_local_mediafile and local_file_stat is None and \
+            not _is_remote_media(media_filename):
+        # It doesn't look like the URI of a remote media file,
+        # but it's not an existing local file either.
+        raise FFprobeMediaFileError(media_filename)
 
     # NOTE #1: Python3 docs say that its `Popen` does not call a system shell:
     #  https://docs.python.org/3/library/subprocess.html#security-considerations
@@ -335,14 +912,163 @@ def probe(media_filename, *,
     #  https://docs.python.org/3/library/subprocess.html#converting-argument-sequence
     #
     # But I don't use Windows, so I can't test anything, sorry...
-    split_cmdline.append(media_filename)
+    read_limit_args = ()
+    if read_interval is not None:
+        # Read only `read_interval` seconds from the start of the media.
+        #  https://ffmpeg.org/ffprobe.html#Main-options
+        read_limit_args += ('-read_intervals', '%%+%s' % read_interval)
+    if analyze_duration_us is not None:
+        read_limit_args += ('-analyzeduration', str(analyze_duration_us))
+    if probe_size is not None:
+        read_limit_args += ('-probesize', str(probe_size))
+
+    # Build the new command-line as a single new list (without any
+    # intermediate tuples), then substitute the command to invoke.
+    split_cmdline = [*_SPLIT_COMMAND_LINE, *read_limit_args, media_filename]
+    split_cmdline[0] = ffprobe_cmd
+    return (split_cmdline, local_file_stat)
+
+
+def _run_ffprobe(split_cmdline, communicate_timeout, input_bytes=None,
+        capture_stderr=True):
+    """Run the ``ffprobe`` command-line `split_cmdline` in a subprocess.
 
+    If `input_bytes` is not ``None``, it's written to the stdin of ``ffprobe``.
+
+    If `capture_stderr` is false, the stderr of ``ffprobe`` is discarded;
+    but if ``ffprobe`` fails, it's run again with stderr captured.
+
+    Returns:
+        the ``bytes`` printed to stdout by the ``ffprobe`` command
+
+    Raises:
+        FFprobeExecutableError: ffprobe command not found in ``$PATH``
+        FFprobePopenError: ``subprocess.Popen`` failed, raised an exception
+        FFprobeSubprocessError: ffprobe command returned non-zero exit status
+        FFprobeTimeoutError: ffprobe command did not finish before timeout
+    """
+    # NOTE #3: We allow the caller of this constructor to specify remote
+    # media files at HTTP or FTP URIs, which might be very slow if there
+    # are network problems.
+    #
+    # Hence, we specify a `timeout` argument to `Popen.communicate`
+    # (a timeout value which may be configured by the caller using the
+    # optional parameter `communicate_timeout`).
+    #
+    # NOTE #4: We use `Popen.communicate` (rather than `Popen.wait`, which
+    # can deadlock when using pipes).  If the timeout expires, we kill the
+    # `ffprobe` subprocess ourselves (rather than letting `subprocess.run`
+    # do it), so that we can also kill any processes that `ffprobe` spawned:
+    # See function `_kill_ffprobe`.  Using `Popen` as a context manager
+    # closes the pipes & waits for the subprocess, however we leave.
+    #
+    # Because we do NOT specify `text=True` (or `universal_newlines=True`),
+    # the captured stdout & stderr are raw `bytes`.  This avoids a decode
+    # pass over the (potentially large) JSON output of `ffprobe`, if `orjson`
+    # is installed to parse the raw `bytes` directly.
+    with _popen_ffprobe(split_cmdline,
+            stdin=(None if input_bytes is None else subprocess.PIPE),
+            stdout=subprocess.PIPE,
+            stderr=(subprocess.PIPE if capture_stderr
+                    else subprocess.DEVNULL)) as proc:
+        try:
+            (outs, errs) = proc.communicate(input_bytes,
+                    timeout=communicate_timeout)
+        except subprocess.TimeoutExpired as e:
+            _kill_ffprobe(proc)
+            raise FFprobeTimeoutError(split_cmdline, communicate_timeout,
+                    _decode_stderr(e.stderr)) from e
+        except BaseException:
+            # E.g., `KeyboardInterrupt`:  Because `ffprobe` is in its own
+            # session, it won't have received the SIGINT from the terminal.
+            _kill_ffprobe(proc)
+            raise
+
+    if proc.returncode != 0 and not capture_stderr:
+        # Run `ffprobe` again, capturing the error message this time.
+        return _run_ffprobe(split_cmdline, communicate_timeout, input_bytes)
+
+    _check_exit_status(split_cmdline, proc.returncode, errs)
+    return outs
+
+
+async def _run_ffprobe_async(split_cmdline, communicate_timeout,
+        input_bytes=None, capture_stderr=True):
+    """Run the ``ffprobe`` command-line `split_cmdline` using ``asyncio``.
+
+    This is the ``asyncio`` equivalent of function :func:`_run_ffprobe`,
+    raising the same exceptions for the same failures.
+
+    Returns:
+        the ``bytes`` printed to stdout by the ``ffprobe`` command
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(*split_cmdline,
+                stdin=(None if input_bytes is None
+                        else asyncio.subprocess.PIPE),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=(asyncio.subprocess.PIPE if capture_stderr
+                        else asyncio.subprocess.DEVNULL),
+                start_new_session=_KILL_PROCESS_GROUP)
+    except FileNotFoundError as e:
+        raise FFprobeExecutableError(split_cmdline[0]) from e
+    except OSError as e:
+        raise FFprobePopenError(e, 'OSError') from e
+    except ValueError as e:
+        raise FFprobePopenError(e, 'ValueError') from e
+
+    try:
+        (outs, errs) = await asyncio.wait_for(proc.communicate(input_bytes),
+                timeout=communicate_timeout)
+    except asyncio.TimeoutError as e:
+        # `asyncio.wait_for` doesn't kill the child process when the timeout
+        # expires; so we must kill & wait for it.  This is the `asyncio`
+        # equivalent of function `_kill_ffprobe`.  (We don't try to read any
+        # more of its output, which might block if a grandchild process that
+        # escaped the process group holds the pipes.)
+        if _KILL_PROCESS_GROUP:
+            _signal_process_group(proc.pid, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(proc.wait(),
+                        timeout=_KILL_GRACE_PERIOD_SECS)
+            except asyncio.TimeoutError:
+                pass
+            _signal_process_group(proc.pid, signal.SIGKILL)
+        else:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                # The child process has already exited.
+                pass
+        await proc.wait()
+        raise FFprobeTimeoutError(split_cmdline, communicate_timeout) from e
+
+    if proc.returncode != 0 and not capture_stderr:
+        # Run `ffprobe` again, capturing the error message this time.
+        return await _run_ffprobe_async(split_cmdline, communicate_timeout,
+                input_bytes)
+
+    _check_exit_status(split_cmdline, proc.returncode, errs)
+    return outs
+
+
+def _popen_ffprobe(split_cmdline, **popen_kwargs):
+    """Start the ``ffprobe`` command-line `split_cmdline` using ``Popen``.
+
+    Returns:
+        a new instance of class ``subprocess.Popen``
+
+    Raises:
+        FFprobeExecutableError: ffprobe command not found in ``$PATH``
+        FFprobePopenError: ``subprocess.Popen`` failed, raised an exception
+    """
+    # On POSIX, run `ffprobe` in a new session (and hence, in a new process
+    # group), so that function `_kill_ffprobe` can kill `ffprobe` together
+    # with any other processes that it spawned.
+    if _KILL_PROCESS_GROUP:
+        popen_kwargs['start_new_session'] = True
     try:
-        # https://docs.python.org/3/library/subprocess.html#subprocess.Popen
-        proc = subprocess.Popen(split_cmdline,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True)
+        return subprocess.Popen(split_cmdline, **popen_kwargs)
     # We catch the following plausible exceptions specifically,
     # in case we decide that we want to process any of them specially.
     except FileNotFoundError as e:
@@ -351,7 +1077,7 @@ def probe(media_filename, *,
         # would be handled by the exception handler for `OSError` that follows;
         # but recognizing `FileNotFoundError` first, enables us to provide a
         # more-specific exception type with a more-descriptive error message.
-        raise FFprobeExecutableError(ffprobe_cmd) from e
+        raise FFprobeExecutableError(split_cmdline[0]) from e
     except OSError as e:
         # https://docs.python.org/3/library/subprocess.html#exceptions
         #   '''
@@ -374,72 +1100,331 @@ def probe(media_filename, *,
         #   '''
         raise FFprobePopenError(e, 'subprocess.SubprocessError') from e
 
-    # NOTE #3: We allow the caller of this constructor to specify remote
-    # media files at HTTP or FTP URIs, which might be very slow if there
-    # are network problems.
-    #
-    # Hence, we specify a `timeout` argument to the following subprocess
-    # function (a timeout value which may be configured by the caller
-    # using the optional parameter `communicate_timeout`).
+
+def _kill_ffprobe(proc):
+    """Kill the ``ffprobe`` subprocess `proc` (and any processes it spawned).
+
+    On POSIX, ``SIGTERM`` is sent to the process group of `proc` (which was
+    started in a new session by :func:`_popen_ffprobe`), to allow ``ffprobe``
+    to exit cleanly (e.g., closing network connections).  Then after a grace
+    period, ``SIGKILL`` is sent to any processes remaining in the group.
+    (Otherwise, only `proc` itself would be killed, and any helper processes
+    that it spawned might linger, holding connections & file descriptors.)
+
+    On other platforms, `proc` itself is simply killed.
+    """
+    if not _KILL_PROCESS_GROUP:
+        proc.kill()
+        return
+
+    _signal_process_group(proc.pid, signal.SIGTERM)
+    try:
+        proc.wait(timeout=_KILL_GRACE_PERIOD_SECS)
+    except subprocess.TimeoutExpired:
+        pass
+    # Even if `ffprobe` has exited, other processes in its group might not.
+    _signal_process_group(proc.pid, signal.SIGKILL)
+
+
+def _signal_process_group(pgid, sig):
+    """Send signal `sig` to process group `pgid`, if the group still exists."""
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        # Every process in the group has already exited.
+        pass
+
+
+def _check_exit_status(split_cmdline, exit_status, errs):
+    """Raise :class:`FFprobeSubprocessError` if ``ffprobe`` failed.
+
+    Raises:
+        FFprobeSubprocessError: ffprobe command returned non-zero exit status
+    """
+    if exit_status != 0:
+        raise FFprobeSubprocessError(split_cmdline, exit_status,
+                _decode_stderr(errs))
+
+
+def _decode_stderr(errs):
+    """Decode the `bytes` printed to stderr by ``ffprobe`` (if any)."""
+    if errs is None:
+        return None
+    return errs.decode('utf-8', errors='replace')
+
+
+@functools.lru_cache(maxsize=256)
+def _run_ffprobe_cached(split_cmdline, file_id, size, mtime_ns,
+        communicate_timeout, capture_stderr=True):
+    """Run (or re-use the output of) ``ffprobe`` for an unchanged local file.
+
+    Arguments `file_id`, `size` & `mtime_ns` are not used in this function;
+    they're only included in the cache key, to detect when the local file
+    changes.  The `file_id` pair ``(st_dev, st_ino)`` identifies the file
+    itself, so a relative filename in `split_cmdline` can't match a different
+    file after the current directory has changed (nor after the file has been
+    replaced by another file with the same size & modification-time).
+
+    (Exceptions are not cached, so a failed ``ffprobe`` run will be re-run.)
+    """
+    return _run_ffprobe(list(split_cmdline), communicate_timeout,
+            capture_stderr=capture_stderr)
+
+# Enable client code to discard all the cached `ffprobe` output.
+probe.cache_clear = _run_ffprobe_cached.cache_clear
+
+
+def _verify_positive_number(arg_name, value, description, number_types):
+    """Verify that `value` is either ``None`` or a positive number.
+
+    Args:
+        arg_name (str): name of the argument that received `value`
+        value: the value to verify
+        description (str): description of the value in error messages
+        number_types (type or tuple of types): the allowed numeric types
+
+    Raises:
+        FFprobeInvalidArgumentError: `value` is non-numeric or non-positive
+    """
+    if value is not None:
+        # Verify that this non-None value is some kind of positive number.
+        if not isinstance(value, number_types):
+            raise FFprobeInvalidArgumentError(arg_name,
+                    'Supplied %s is non-None and non-%s' % (description,
+                            'integer' if number_types is int else 'numeric'),
+                    value)
+        if value <= 0:
+            raise FFprobeInvalidArgumentError(arg_name,
+                    'Supplied %s is non-None and non-positive' % description,
+                    value)
+
+
+def _is_remote_media(media_filename):
+    """Return whether `media_filename` looks like the URI of remote media."""
+    # How do we detect when the media file is remote rather than local?
+    # If you run `ffprobe -protocols`, it prints the file protocols that
+    # it supports.  On my system, that list (joined at newlines) is:
     #
-    # NOTE #4: We use `Popen.communicate` rather than `Popen.wait`,
-    # because as the docs for `Popen.wait` warn us:
-    #  https://docs.python.org/3/library/subprocess.html#subprocess.Popen.wait
-    #   '''
-    #   Note: This will deadlock when using `stdout=PIPE` or `stderr=PIPE`
-    #   and the child process generates enough output to a pipe such that
-    #   it blocks waiting for the OS pipe buffer to accept more data.
-    #   Use `Popen.communicate()` when using pipes to avoid that.
-    #   '''
+    #       Input: async bluray cache concat crypto data file ftp gopher
+    #       hls http httpproxy https mmsh mmst pipe rtp sctp srtp subfile
+    #       tcp tls udp udplite unix rtmp rtmpe rtmps rtmpt rtmpte sftp
     #
-    # The docs for `Popen.communicate` helpfully provide the code idiom
-    # that we should use here:
-    #  https://docs.python.org/3/library/subprocess.html#subprocess.Popen.communicate
-    #   '''
-    #   If the process does not terminate after `timeout` seconds,
-    #   a `TimeoutExpired` exception will be raised. Catching this
-    #   exception and retrying communication will not lose any output.
+    # But rather than hard-coding a list of protocols, let's just match
+    # anything that *looks* like a URI Scheme:
+    #  https://en.wikipedia.org/wiki/Uniform_Resource_Identifier#Syntax
+    #  https://en.wikipedia.org/wiki/List_of_URI_schemes
     #
-    #   The child process is not killed if the timeout expires, so
-    #   in order to cleanup properly a well-behaved application should
-    #   kill the child process and finish communication:
-    #   '''
+    # This is equivalent to matching the regex `^[a-z][a-z0-9-]*://`, but it
+    # avoids the overhead of the regex engine:  For a local file-path (which
+    # usually doesn't contain "://" at all), `str.find` returns after a single
+    # fast scan of the string.
+    sep = media_filename.find('://')
+    if sep <= 0:
+        return False
+    scheme = media_filename[:sep]
+    return (scheme.isascii() and scheme[0].isalpha() and scheme.islower()
+            and scheme.replace('-', '').isalnum())
+
+
+def _stat_local_mediafile(media_filename):
+    """Return the ``os.stat_result`` of a local media file; else ``None``.
+
+    Return ``None`` for remote media, or if `media_filename` is not a file.
+    """
+    if _is_remote_media(media_filename):
+        return None
     try:
-        (outs, errs) = proc.communicate(timeout=communicate_timeout)
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        (outs, errs) = proc.communicate()
-    # Because we specified `universal_newlines=True` to `subprocess.Popen`,
-    # `outs` & `errs` are text strings.
-    #
-    # XXX: I'm using `Popen.communicate`; so this function will close the
-    # pipes for me automatically, right?  Because `Popen.communicate` waits
-    # for the process to terminate?  Meaning it internally calls `Popen.wait`
-    # or something similar?  Which closes the pipes?  I'm just being extra
-    # careful, because the docs are not entirely clear on the matter:
-    #   '''
-    #   Read data from stdout and stderr, until end-of-file is reached.
-    #   Wait for process to terminate and set the `returncode` attribute.
-    #   '''
-    # and:
-    #   '''
-    #   The child process is not killed if the timeout expires, so in order
-    #   to cleanup properly a well-behaved application should kill the
-    #   child process and finish communication:
-    #   '''
+        st = os.stat(media_filename)
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return st
+
+
+def _parse_json_output(outs, *, lazy_json=False):
+    """Parse the raw `bytes` of JSON output by ``ffprobe``.
+
+    Use ``simdjson`` if `lazy_json` is true & it's installed; else use
+    ``orjson`` if it's installed; else fall back to standard ``json``.
 
+    Raises:
+        FFprobeJsonParseError: JSON parser was unable to parse ffprobe output
+    """
     try:
-        parsed_json = json.loads(outs)
+        if lazy_json and simdjson is not None:
+            # Use a new parser for each document, because re-using a parser
+            # would invalidate any proxies into its previous document.
+            return simdjson.Parser().parse(outs)
+        elif orjson is not None:
+            return orjson.loads(outs)
+        else:
+            return json.loads(outs.decode('utf-8'))
+    # Note that `orjson.JSONDecodeError` is a subclass of
+    # `json.decoder.JSONDecodeError`, so this handles both parsers.
     except json.decoder.JSONDecodeError as e:
         raise FFprobeJsonParseError(e, 'json.decoder.JSONDecodeError') from e
-    exit_status = proc.returncode
-    if exit_status != 0:
-        raise FFprobeSubprocessError(split_cmdline, exit_status, errs)
+    except UnicodeDecodeError as e:
+        raise FFprobeJsonParseError(e, 'UnicodeDecodeError') from e
+    # Note that `simdjson` raises `ValueError` for invalid JSON.
+    except ValueError as e:
+        raise FFprobeJsonParseError(e, 'ValueError') from e
+
+
+def _to_float(value, default=None):
+    """Convert a parsed JSON `value` to a ``float``; else return `default`.
+
+    This implements method :func:`ParsedJson.get_as_float` (after the lookup).
+    It's also called directly by the constructors of derived classes of
+    :class:`ParsedJson`, to avoid the overhead of a method call.
+    """
+    if value is None:
+        return default
+    if type(value) is float:
+        # No conversion needed.  (But a `bool` will still be converted.)
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        # The value is not a number, nor a string that contains a number.
+        return default
+
+
+def _to_int(value, default=None):
+    """Convert a parsed JSON `value` to an ``int``; else return `default`.
 
-    return FFprobe(split_cmdline=split_cmdline, parsed_json=parsed_json)
+    This implements method :func:`ParsedJson.get_as_int` (after the lookup).
+    It's also called directly by the constructors of derived classes of
+    :class:`ParsedJson`, to avoid the overhead of a method call.
+    """
+    if value is None:
+        return default
+    if type(value) is int:
+        # No conversion needed.  (But a `bool` will still be converted.)
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        # The value is not a number, nor a string that contains a number
+        # (or it's a "nan" or "inf" string, which `int` can't convert).
+        return default
+
+
+def _to_kbps(bit_rate_bps):
+    """Convert an ``int`` bit-rate in bps to a ``float`` in kbps (or ``None``).
+
+    (The bit-rate in bps is obtained by method ``get_as_int``,
+    so it's already either an ``int`` or ``None``.)
+    """
+    if bit_rate_bps is None:
+        return None
+    return bit_rate_bps / 1000
+
+
+def _format_datasize_human(num, default=None, *, suffix='', use_base_10=True):
+    """Format a data-size `num` in a "human-readable" format (with `suffix`).
+
+    This implements method :func:`ParsedJson.get_datasize_as_human` (after
+    the lookup & conversion to ``float``).  It's also called directly by the
+    property :attr:`FFformat.size_human`, which passes the size that the
+    constructor has already converted.
+
+    Return `default` if `num` is ``None``.
+    """
+    if num is None:
+        return default
+    if use_base_10:
+        # This is the default, because it's what `ls -lh` does.
+        divisor = 1000.0
+        unit_prefixes = _SI_PREFIXES
+    else:
+        # Use base 2 instead.
+        divisor = 1024.0
+        unit_prefixes = _BINARY_PREFIXES
+
+    try:
+        abs_num = abs(num)
+        if abs_num < divisor:
+            idx = 0
+        elif not math.isfinite(abs_num):
+            idx = len(_SI_PREFIXES) - 1
+        else:
+            # Calculate the index of the unit prefix directly, rather than
+            # dividing `num` by `divisor` repeatedly in a loop.
+            idx = min(int(math.log(abs_num, divisor)),
+                    len(_SI_PREFIXES) - 1)
+            # But `math.log` may be slightly inaccurate at (or very near)
+            # an exact power of `divisor` (e.g., `math.log(1e6, 1000)` is
+            # `1.9999999999999996`), so correct any off-by-one error.
+            if idx < len(_SI_PREFIXES) - 1 and \
+                    abs_num >= divisor ** (idx + 1):
+                idx += 1
+            elif abs_num < divisor ** idx:
+                idx -= 1
+            num /= divisor ** idx
+        # The largest unit is "Yotta-" ('Y'), the largest decimal unit
+        # prefix in the metric system:
+        #  https://en.wikipedia.org/wiki/Yotta-
+        # (If we're using base 2, the unit prefix is already postfixed
+        # by 'i' in `_BINARY_PREFIXES`.)
+        return "%3.1f %s%s" % (num, unit_prefixes[idx], suffix)
+    except Exception:
+        return default
+
+
+def _format_duration_human(duration_secs, default=None):
+    """Format a duration in seconds as a string ``"HH:MM:SS.ss"``.
+
+    This implements method :func:`ParsedJson.get_duration_as_human` (after
+    the lookup & conversion to ``float``).  It's also called directly by the
+    property :attr:`FFformat.duration_human`, which passes the duration that
+    the constructor has already converted.
+
+    Return `default` if `duration_secs` is ``None`` or is not finite.
+    """
+    try:
+        # Minutes, seconds
+        duration_mins = duration_secs // 60
+        duration_secs -= duration_mins * 60
+        # Hours, minutes, seconds
+        duration_hours = duration_mins // 60
+        duration_mins -= duration_hours * 60
+        duration_hours = int(duration_hours)
+        duration_mins = int(duration_mins)
+    except (TypeError, ValueError, OverflowError):
+        # `None` (not found), or `nan` or `inf`.
+        return default
+    seconds_str = "%05.2f" % duration_secs
+    if seconds_str == "60.00":
+        # The seconds (such as 59.999) were rounded up to a whole minute by
+        # the format; so carry it, to display "00:01:00.00" (rather than
+        # "00:00:60.00").
+        seconds_str = "00.00"
+        duration_mins += 1
+        if duration_mins == 60:
+            duration_mins = 0
+            duration_hours += 1
+    return "%02d:%02d:%s" % (duration_hours, duration_mins, seconds_str)
+
+
+def _truncate_repr(repr_str, max_len):
+    """Truncate `repr_str` to `max_len` characters (unless `max_len` is None).
+    """
+    if max_len is None or len(repr_str) <= max_len:
+        return repr_str
+    return '%s...<%d more chars>' % (repr_str[:max_len],
+            len(repr_str) - max_len)
+
+
+def _materialize(parsed_json):
+    """Return `parsed_json` as a ``dict`` (if it's a lazy ``simdjson`` proxy)."""
+    as_dict = getattr(parsed_json, 'as_dict', None)
+    if as_dict is not None:
+        return as_dict()
+    return parsed_json
 
 
-class ParsedJson(Mapping):
+class ParsedJson:
     """
     Class `ParsedJson` contains a dictionary of parsed JSON.
 
@@ -458,6 +1443,11 @@ class ParsedJson(Mapping):
     original tree** of ``dict`` instances that was returned by ``json.loads``;
     they will each reference a different subtree of the shared tree.
 
+    (If function :func:`probe` was called with ``lazy_json=True``, the parsed
+    JSON will instead be a read-only, lazily-decoded ``simdjson.Object``
+    proxy, which will be converted to a ``dict`` only when necessary, such as
+    by :func:`__repr__`.)
+
     This class provides some convenient accessor methods for parsed JSON keys:
 
     - Python `abstract Mapping <https://docs.python.org/3/library/collections.abc.html#collections-abstract-base-classes>`_
@@ -500,6 +1490,29 @@ class ParsedJson(Mapping):
     of those derived classes.
     """
 
+    # Each derived class declares its data attributes in `__slots__`, so that
+    # instances don't each carry a per-instance `__dict__`.  (A program may
+    # construct many thousands of these instances, one per stream & chapter.)
+    __slots__ = ('parsed_json',)
+
+    # If this is not `None`, `__repr__` will truncate the `repr` of the parsed
+    # JSON to this many characters (which will prevent `eval` of the `repr`).
+    _repr_max_len = None
+
+    # Per-class caches of the names returned by `list_attr_names` &
+    # `list_getter_names`, which are computed on the first call.
+    _attr_names = None
+    _getter_names = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Give each derived class its own caches of attribute & getter names.
+
+        (Otherwise, a derived class would inherit its base class's caches.)
+        """
+        super().__init_subclass__(**kwargs)
+        cls._attr_names = None
+        cls._getter_names = None
+
     def __init__(self, parsed_json):
         """Construct a wrapper that references the ``dict``-like `parsed_json`.
 
@@ -511,7 +1524,12 @@ class ParsedJson(Mapping):
         # Verify that the supplied `parsed_json` allows value lookup
         # by string keys (even if `parsed_json` is actually empty).
         # We rely on this duck-type assumption later.
-        if not isinstance(parsed_json, Mapping):
+        #
+        # The exact-type check for `dict` (the result of `json.loads` or
+        # `orjson.loads`) comes first, because it's much faster than the
+        # `isinstance` check of an abstract base class.
+        if type(parsed_json) is not dict and \
+                not isinstance(parsed_json, Mapping):
             raise FFprobeInvalidArgumentError('parsed_json',
                     'Supplied parsed JSON is not a dictionary',
                     parsed_json)
@@ -542,7 +1560,7 @@ class ParsedJson(Mapping):
         `abstract Mapping <https://docs.python.org/3/library/collections.abc.html#collections-abstract-base-classes>`_
         interface.
         """
-        return self.parsed_json == other.parsed_json
+        return _materialize(self.parsed_json) == _materialize(other.parsed_json)
 
     def __getitem__(self, key):
         """Return the value for `key`, if `key` in parsed JSON; else raise `KeyError`.
@@ -560,7 +1578,7 @@ class ParsedJson(Mapping):
         `abstract Mapping <https://docs.python.org/3/library/collections.abc.html#collections-abstract-base-classes>`_
         interface.
         """
-        yield from self.parsed_json
+        return iter(self.parsed_json)
 
     def __len__(self):
         """Return the count of keys in parsed JSON.
@@ -613,9 +1631,20 @@ class ParsedJson(Mapping):
         [**Standard disclaimer:**  Using ``eval`` on untrusted strings
         (from an external source) is dangerous and insecure.  Don't use
         ``eval`` on untrusted strings!]
+
+        **Note:** The ``repr`` of the root :class:`FFprobe` instance contains
+        *all* the parsed JSON, which may be hundreds of KB for some media.
+        To avoid accidentally logging such huge strings, you may set the
+        class attribute ``ParsedJson._repr_max_len`` to a positive ``int``
+        (e.g., ``ffprobe3.ParsedJson._repr_max_len = 200``).  Then the ``repr``
+        of the parsed JSON will be truncated to that many characters, followed
+        by ``...<N more chars>``.  (Of course, a truncated ``repr`` can't be
+        reconstructed using ``eval``.)  The default is ``None`` (no truncation).
         """
         return '%s(parsed_json=%s)' % \
-                (type(self).__qualname__, repr(self.parsed_json))
+                (type(self).__qualname__,
+                        _truncate_repr(repr(_materialize(self.parsed_json)),
+                                self._repr_max_len))
 
     def get(self, key, default=None):
         """Return the value for `key`, if `key` in parsed JSON; else `default`.
@@ -641,10 +1670,9 @@ class ParsedJson(Mapping):
 
         This method will never raise an exception.
         """
-        try:
-            return float(self.parsed_json[key])
-        except Exception:
-            return default
+        # Look up the value without raising & catching a `KeyError`,
+        # because ffprobe omits many keys, so missing keys are common.
+        return _to_float(self.parsed_json.get(key), default)
 
     def get_as_int(self, key, default=None):
         """Return the value for `key` as an ``int``, if `key` is in parsed JSON
@@ -660,10 +1688,9 @@ class ParsedJson(Mapping):
 
         This method will never raise an exception.
         """
-        try:
-            return int(self.parsed_json[key])
-        except Exception:
-            return default
+        # Look up the value without raising & catching a `KeyError`,
+        # because ffprobe omits many keys, so missing keys are common.
+        return _to_int(self.parsed_json.get(key), default)
 
     def get_datasize_as_human(self, key, default=None, *,
             suffix='', use_base_10=True):
@@ -689,34 +1716,8 @@ class ParsedJson(Mapping):
         Note that if `default` is returned, no `suffix` will be appended
         within the result.  (How do you append a string suffix to ``None``?)
         """
-        if use_base_10:
-            # This is the default, because it's what `ls -lh` does.
-            divisor = 1000.0
-        else:
-            # Use base 2 instead.
-            divisor = 1024.0
-
-        try:
-            num = float(self.parsed_json[key])
-            for unit in ['', 'k', 'M', 'G', 'T', 'P', 'E', 'Z']:
-                if abs(num) < divisor:
-                    if unit and not use_base_10:
-                        # We're not using base 10; it must be base 2 instead.
-                        # And there is a non-empty unit (e.g., 'k', 'M', etc.).
-                        # So, postfix the unit by 'i' (e.g., 'ki', 'Mi', etc.).
-                        return "%3.1f %si%s" % (num, unit, suffix)
-                    return "%3.1f %s%s" % (num, unit, suffix)
-                num /= divisor
-            # The number is large enough that we've reached "Yotta-" ('Y'),
-            # the largest decimal unit prefix in the metric system:
-            #  https://en.wikipedia.org/wiki/Yotta-
-            if not use_base_10:
-                # We're not using base 10; it must be base 2 instead.
-                # So, postfix the unit by 'i' (ie, 'Yi').
-                return "%.1f %s%s" % (num, 'Yi', suffix)
-            return "%.1f %s%s" % (num, 'Y', suffix)
-        except Exception:
-            return default
+        return _format_datasize_human(_to_float(self.parsed_json.get(key)),
+                default, suffix=suffix, use_base_10=use_base_10)
 
     def get_duration_as_human(self, default=None):
         """Return the duration as a string ``"HH:MM:SS.ss"``; else `default`.
@@ -731,19 +1732,8 @@ class ParsedJson(Mapping):
 
         This method will never raise an exception.
         """
-        try:
-            # Only the seconds
-            duration_secs = float(self.parsed_json["duration"])
-            # Minutes, seconds
-            duration_mins = duration_secs // 60
-            duration_secs -= duration_mins * 60
-            # Hours, minutes, seconds
-            duration_hours = duration_mins // 60
-            duration_mins -= duration_hours * 60
-            return "%02d:%02d:%05.2f" % \
-                    (int(duration_hours), int(duration_mins), duration_secs)
-        except Exception:
-            return default
+        return _format_duration_human(
+                _to_float(self.parsed_json.get("duration")), default)
 
     def list_attr_names(self):
         """Return the names of pre-defined attributes in this class.
@@ -779,13 +1769,15 @@ class ParsedJson(Mapping):
             'codec_long_name', 'codec_name', 'codec_type',
             'duration_secs', 'index', 'num_channels', 'parsed_json',
             'sample_rate_Hz']
+
+        Note: Because every instance of a class has the same pre-defined
+        attributes, the list of names is computed (using ``dir``) only once
+        per class, and then cached in the class.
         """
-        return [attr_name for attr_name in dir(self)
-                if not (attr_name.startswith("_") or
-                        attr_name.startswith("get") or
-                        attr_name.startswith("is_") or
-                        attr_name.startswith("list_") or
-                        attr_name in ("keys", "items", "values"))]
+        cls = type(self)
+        if cls._attr_names is None:
+            self._cache_names()
+        return list(cls._attr_names)
 
     def list_getter_names(self):
         """Return the names of dict-lookup getter-methods in this class.
@@ -820,9 +1812,27 @@ class ParsedJson(Mapping):
             '01:57:56.15'
             >>> v.get_frame_shape()
             (1904, 1072)
+
+        Note: The list of names is computed (using ``dir``) only once per
+        class, and then cached in the class.
         """
-        return [attr_name for attr_name in dir(self)
-                if attr_name.startswith("get")]
+        cls = type(self)
+        if cls._getter_names is None:
+            self._cache_names()
+        return list(cls._getter_names)
+
+    def _cache_names(self):
+        """Compute & cache the names of attributes & getters in this class.
+
+        Both lists of names are filtered from a single call to ``dir``.
+        """
+        cls = type(self)
+        names = dir(self)
+        cls._attr_names = tuple(attr_name for attr_name in names
+                if not (attr_name.startswith(_NON_ATTR_NAME_PREFIXES) or
+                        attr_name in _NON_ATTR_NAMES))
+        cls._getter_names = tuple(attr_name for attr_name in names
+                if attr_name.startswith("get"))
 
     def keys(self):
         """Return the keys in the top-level dictionary of parsed JSON.
@@ -849,6 +1859,35 @@ class ParsedJson(Mapping):
         """
         return self.parsed_json.keys()
 
+    def items(self):
+        """Return the (key, value) pairs in the top-level dictionary of parsed JSON.
+
+        This method is part of the Python
+        `abstract Mapping <https://docs.python.org/3/library/collections.abc.html#collections-abstract-base-classes>`_
+        interface.
+        """
+        return self.parsed_json.items()
+
+    def values(self):
+        """Return the values in the top-level dictionary of parsed JSON.
+
+        This method is part of the Python
+        `abstract Mapping <https://docs.python.org/3/library/collections.abc.html#collections-abstract-base-classes>`_
+        interface.
+        """
+        return self.parsed_json.values()
+
+    # Like `Mapping`, prevent `reversed` from treating this as a sequence.
+    __reversed__ = None
+
+
+# Class `ParsedJson` implements the `Mapping` interface itself, forwarding each
+# method directly to the parsed JSON, rather than inheriting from `Mapping`:
+# This avoids the overhead of the `Mapping` mixin methods (e.g., `Mapping.items`
+# returns an `ItemsView` that calls back into `__iter__` & `__getitem__`).
+# But we register it as a virtual subclass, so `isinstance(x, Mapping)` works.
+Mapping.register(ParsedJson)
+
 
 class FFprobe(ParsedJson):
     """
@@ -876,6 +1915,10 @@ class FFprobe(ParsedJson):
     :ivar subtitle: (list of :class:`FFsubtitleStream`) only parsed subtitle streams
     :ivar video: (list of :class:`FFvideoStream`) only parsed video streams
 
+    (The ``chapters``, ``attachment``, ``audio``, ``subtitle`` & ``video``
+    lists are not constructed until they are first accessed, since most client
+    code only examines one or two of them.)
+
     In addition, the original ``dict`` instance of the parsed JSON output
     from ``ffprobe`` can always be accessed directly in the ``.parsed_json``
     attribute of base class :class:`ParsedJson`.
@@ -902,6 +1945,10 @@ class FFprobe(ParsedJson):
     Raises:
         FFprobeInvalidArgumentError: invalid value supplied for function argument
     """
+    __slots__ = ('split_cmdline', 'executed_cmd', 'media_filename',
+            'format', 'streams', '_chapters',
+            '_attachment', '_audio', '_subtitle', '_video')
+
     def __init__(self, *, split_cmdline=[], parsed_json={}):
         # Verify that `split_cmdline` is a non-string sequence that contains
         # at least 2 strings (ie, the command name & the media file name).
@@ -922,16 +1969,32 @@ class FFprobe(ParsedJson):
                     split_cmdline) from e
 
         try:
-            for s in split_cmdline:
-                if not isinstance(s, str):
-                    raise FFprobeInvalidArgumentError('split_cmdline',
-                            'Supplied split command-line contains non-strings',
-                            split_cmdline)
+            all_strings = all(isinstance(s, str) for s in split_cmdline)
         except (AttributeError, TypeError, ValueError) as e:
+            # It has a length, but it's not iterable.
             raise FFprobeInvalidArgumentError('split_cmdline',
                     'Supplied split command-line is not a sequence',
                     split_cmdline) from e
+        if not all_strings:
+            raise FFprobeInvalidArgumentError('split_cmdline',
+                    'Supplied split command-line contains non-strings',
+                    split_cmdline)
 
+        self._init_attrs(split_cmdline, parsed_json)
+
+    @classmethod
+    def _from_probe(cls, split_cmdline, parsed_json):
+        """Construct an instance, without verifying `split_cmdline`.
+
+        This is called by function :func:`probe` (and similar functions),
+        which built `split_cmdline` itself, so it's already known to be valid.
+        """
+        self = cls.__new__(cls)
+        self._init_attrs(split_cmdline, parsed_json)
+        return self
+
+    def _init_attrs(self, split_cmdline, parsed_json):
+        """Initialize the attributes of a new instance (after verification)."""
         self.split_cmdline = split_cmdline
         self.executed_cmd = split_cmdline[0]
         self.media_filename = split_cmdline[-1]
@@ -939,20 +2002,102 @@ class FFprobe(ParsedJson):
         super().__init__(parsed_json)
         # Pick out some particular expected keys from the parsed JSON.
         self.format = FFformat(self.get("format", {}))
-        self.streams = [_construct_ffstream_subclass(stream)
-                for stream in self.get("streams", [])]
-        self.chapters = [FFchapter(chapter)
-                for chapter in self.get("chapters", [])]
 
-        self.attachment =   [s for s in self.streams if s.is_attachment()]
-        self.audio =        [s for s in self.streams if s.is_audio()]
-        self.subtitle =     [s for s in self.streams if s.is_subtitle()]
-        self.video =        [s for s in self.streams if s.is_video()]
+        # The chapters are rarely examined (and many media files have none
+        # anyway), so the list is only constructed upon first access of the
+        # `chapters` property.  Likewise, the per-codec-type lists of streams
+        # are only constructed upon first access of any of the properties
+        # `attachment`, `audio`, `subtitle` or `video`.
+        self._chapters =    None
+        self._attachment =  None
+        self._audio =       None
+        self._subtitle =    None
+        self._video =       None
+
+        # Construct each stream as the derived class of `FFstream` for its
+        # "codec_type" (as in function `_construct_ffstream_subclass`).
+        get_subclass = _KNOWN_FFSTREAM_SUBCLASSES.get
+        self.streams = [
+                get_subclass(stream_json.get('codec_type'),
+                        FFstream)._from_probe(stream_json)
+                for stream_json in self.get("streams", [])]
+
+    @property
+    def chapters(self):
+        """Return the list of parsed chapters (constructed upon first access)."""
+        if self._chapters is None:
+            self._chapters = [FFchapter(chapter)
+                    for chapter in self.get("chapters", [])]
+        return self._chapters
+
+    @property
+    def attachment(self):
+        """Return the list of parsed attachment streams (constructed upon first access)."""
+        if self._attachment is None:
+            self._bucket_streams()
+        return self._attachment
+
+    @property
+    def audio(self):
+        """Return the list of parsed audio streams (constructed upon first access)."""
+        if self._audio is None:
+            self._bucket_streams()
+        return self._audio
+
+    @property
+    def subtitle(self):
+        """Return the list of parsed subtitle streams (constructed upon first access)."""
+        if self._subtitle is None:
+            self._bucket_streams()
+        return self._subtitle
+
+    @property
+    def video(self):
+        """Return the list of parsed video streams (constructed upon first access)."""
+        if self._video is None:
+            self._bucket_streams()
+        return self._video
+
+    def _bucket_streams(self):
+        """Sort the parsed streams into the per-codec-type lists, in a single pass."""
+        self._attachment =  []
+        self._audio =       []
+        self._subtitle =    []
+        self._video =       []
+        bucket = {
+            'attachment':   self._attachment,
+            'audio':        self._audio,
+            'subtitle':     self._subtitle,
+            'video':        self._video,
+        }
+        for stream in self.streams:
+            stream_list = bucket.get(stream.codec_type)
+            if stream_list is not None:
+                stream_list.append(stream)
+
+    def _discard_parsed_json(self):
+        """Replace the parsed JSON of every instance in this tree by an empty dict.
+
+        This is called by function :func:`probe` if `retain_json` is false.
+        """
+        # First construct the lazily-constructed lists, which need the JSON.
+        chapters = self.chapters
+        if self._audio is None:
+            self._bucket_streams()
+
+        self.parsed_json = {}
+        self.format.parsed_json = {}
+        for stream in self.streams:
+            stream.parsed_json = {}
+        for chapter in chapters:
+            chapter.parsed_json = {}
 
     def __repr__(self):
         """Return a string that would yield an object with the same value."""
         return '%s(split_cmdline=%s, parsed_json=%s)' % \
-                (type(self).__qualname__, self.split_cmdline, self.parsed_json)
+                (type(self).__qualname__, self.split_cmdline,
+                        _truncate_repr(repr(_materialize(self.parsed_json)),
+                                self._repr_max_len))
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
@@ -992,6 +2137,9 @@ class FFformat(ParsedJson):
     :ivar size_B: (``int`` or ``None``) media size in Bytes
     :ivar size_human: (``str`` or ``None``) media size in "human-readable" base-10 prefix format (e.g., ``"567.8 MB"``)
 
+    (The "human-readable" ``duration_human`` & ``size_human`` are properties
+    that are only formatted when they are accessed.)
+
     In addition, the original ``dict`` instance of the parsed JSON output
     from ``ffprobe`` can always be accessed directly in the ``.parsed_json``
     attribute of base class :class:`ParsedJson`.
@@ -1000,20 +2148,32 @@ class FFformat(ParsedJson):
     It is constructed by function :func:`probe`.  But client code *will* want
     to examine the attributes of a returned instance of this class.
     """
+    __slots__ = ('format_name', 'format_long_name',
+            'duration_secs', 'num_streams',
+            'bit_rate_bps', 'bit_rate_kbps', 'size_B')
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
-        self.format_name =          self.get('format_name')
-        self.format_long_name =     self.get('format_long_name')
-        self.duration_secs =        self.get_as_float('duration')
-        self.duration_human =       self.get_duration_as_human()
-        self.num_streams =          self.get_as_int('nb_streams')
-        self.bit_rate_bps =         self.get_as_int('bit_rate')
-        try:
-            self.bit_rate_kbps = float(self.bit_rate_bps) / 1000.0
-        except (TypeError, ValueError):
-            self.bit_rate_kbps = None
-        self.size_B =               self.get_as_int('size')
-        self.size_human =           self.get_datasize_as_human('size', suffix='B')
+        get = parsed_json.get
+        self.format_name =          get('format_name')
+        self.format_long_name =     get('format_long_name')
+        self.duration_secs =        _to_float(get('duration'))
+        self.num_streams =          _to_int(get('nb_streams'))
+        self.bit_rate_bps =         _to_int(get('bit_rate'))
+        self.bit_rate_kbps = _to_kbps(self.bit_rate_bps)
+        self.size_B =               _to_int(get('size'))
+
+    @property
+    def duration_human(self):
+        """Return the duration in "human-readable" ``HH:MM:SS.ss`` format."""
+        return _format_duration_human(self.duration_secs)
+
+    @property
+    def size_human(self):
+        """Return the size in "human-readable" base-10 prefix format."""
+        # Format the already-converted `size_B` (rather than the JSON value),
+        # which remains available even if the parsed JSON has been discarded.
+        return _format_datasize_human(_to_float(self.size_B), suffix='B')
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
@@ -1050,15 +2210,19 @@ class FFchapter(ParsedJson):
     It is constructed by function :func:`probe`.  But client code *will* want
     to examine the attributes of a returned instance of this class.
     """
+    __slots__ = ('id', 'title')
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
-        self.id = self.get('id')
+        self.id = parsed_json.get('id')
         # This JSON might not have a "tags" key; or the value of the "tags" key
         # might not be a nested dictionary; or that nested dictionary might not
-        # have a "title" key.
-        try:
-            self.title = self['tags']['title']
-        except Exception:
+        # have a "title" key.  (Check for these, rather than raising & catching
+        # an exception, because chapters without titles are common.)
+        tags = parsed_json.get('tags')
+        if type(tags) is dict or isinstance(tags, Mapping):
+            self.title = tags.get('title')
+        else:
             self.title = None
 
     def __str__(self):
@@ -1067,6 +2231,11 @@ class FFchapter(ParsedJson):
                 (type(self).__qualname__, self.id, self.title)
 
 
+# The derived classes of `FFstream` for each known "codec_type".
+# Each derived class registers itself (in `FFstream.__init_subclass__`).
+_KNOWN_FFSTREAM_SUBCLASSES = {}
+
+
 class FFstream(ParsedJson):
     """
     Class `FFstream` is an individual stream in some media probed by ``ffprobe``.
@@ -1111,13 +2280,62 @@ class FFstream(ParsedJson):
     It is constructed by function :func:`probe`.  But client code *will* want
     to examine the attributes of a returned instance of this class.
     """
+    __slots__ = ('index', 'codec_type', 'codec_name', 'codec_long_name',
+            'duration_secs')
+
+    # The "codec_type" that is required by a derived class (if any).
+    _required_codec_type = None
+
+    def __init_subclass__(cls, codec_type=None, **kwargs):
+        """Register a derived class for the "codec_type" it corresponds to.
+
+        A derived class that corresponds to a specific kind of stream declares
+        its ``codec_type`` as a keyword in its class definition::
+
+            class FFaudioStream(FFstream, codec_type='audio'):
+                ...
+
+        which registers it in ``_KNOWN_FFSTREAM_SUBCLASSES`` (so it will be
+        constructed for each stream of that kind); and which requires that
+        `parsed_json` supplied to its constructor has that ``codec_type``.
+        """
+        super().__init_subclass__(**kwargs)
+        if codec_type is not None:
+            cls._required_codec_type = codec_type
+            _KNOWN_FFSTREAM_SUBCLASSES[codec_type] = cls
+
     def __init__(self, parsed_json):
         super().__init__(parsed_json)
-        self.index =            self.get('index')
-        self.codec_type =       self.get('codec_type')
-        self.codec_name =       self.get('codec_name')
-        self.codec_long_name =  self.get('codec_long_name')
-        self.duration_secs =    self.get_as_float('duration')
+        self._init_attrs(parsed_json)
+        required_codec_type = self._required_codec_type
+        if required_codec_type is not None and \
+                self.codec_type != required_codec_type:
+            raise FFprobeStreamSubclassError(
+                    type(self).__qualname__, self.codec_type,
+                    required_codec_type)
+
+    @classmethod
+    def _from_probe(cls, parsed_json):
+        """Construct an instance, without verifying the "codec_type".
+
+        This is called by class :class:`FFprobe` (and similar code), which
+        has already looked up this class by the "codec_type" in `parsed_json`,
+        so the check of the required "codec_type" in the constructor would
+        always pass.
+        """
+        self = cls.__new__(cls)
+        ParsedJson.__init__(self, parsed_json)
+        self._init_attrs(parsed_json)
+        return self
+
+    def _init_attrs(self, parsed_json):
+        """Initialize the attributes of a new instance (after verification)."""
+        get = parsed_json.get
+        self.index =            get('index')
+        self.codec_type =       get('codec_type')
+        self.codec_name =       get('codec_name')
+        self.codec_long_name =  get('codec_long_name')
+        self.duration_secs =    _to_float(get('duration'))
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
@@ -1142,7 +2360,7 @@ class FFstream(ParsedJson):
         return self.codec_type == 'video'
 
 
-class FFattachmentStream(FFstream):
+class FFattachmentStream(FFstream, codec_type='attachment'):
     """
     Class `FFattachmentStream` is an individual attachment stream in some media
     probed by ``ffprobe``.
@@ -1158,11 +2376,7 @@ class FFattachmentStream(FFstream):
     Raises:
         FFprobeStreamSubclassError: ``(codec_type != "attachment")``
     """
-    def __init__(self, parsed_json):
-        super().__init__(parsed_json)
-        if self.codec_type != 'attachment':
-            raise FFprobeStreamSubclassError(
-                    type(self).__qualname__, self.codec_type, 'attachment')
+    __slots__ = ()
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
@@ -1171,7 +2385,7 @@ class FFattachmentStream(FFstream):
                         self.codec_type, self.codec_name)
 
 
-class FFaudioStream(FFstream):
+class FFaudioStream(FFstream, codec_type='audio'):
     """
     Class `FFaudioStream` is an individual audio stream in some media
     probed by ``ffprobe``.
@@ -1197,21 +2411,19 @@ class FFaudioStream(FFstream):
     Raises:
         FFprobeStreamSubclassError: ``(codec_type != "audio")``
     """
-    def __init__(self, parsed_json):
-        super().__init__(parsed_json)
-        if self.codec_type != 'audio':
-            raise FFprobeStreamSubclassError(
-                    type(self).__qualname__, self.codec_type, 'audio')
-
-        self.num_channels =     self.get_as_int('channels')
-        self.num_frames =       self.get_as_int('nb_frames')
-        self.channel_layout =   self.get('channel_layout')
-        self.sample_rate_Hz =   self.get_as_int('sample_rate')
-        self.bit_rate_bps =     self.get_as_int('bit_rate')
-        try:
-            self.bit_rate_kbps = float(self.bit_rate_bps) / 1000.0
-        except (TypeError, ValueError):
-            self.bit_rate_kbps = None
+    __slots__ = ('num_channels', 'num_frames', 'channel_layout',
+            'sample_rate_Hz', 'bit_rate_bps', 'bit_rate_kbps')
+
+    def _init_attrs(self, parsed_json):
+        """Initialize the attributes of a new instance (after verification)."""
+        FFstream._init_attrs(self, parsed_json)
+        get = parsed_json.get
+        self.num_channels =     _to_int(get('channels'))
+        self.num_frames =       _to_int(get('nb_frames'))
+        self.channel_layout =   get('channel_layout')
+        self.sample_rate_Hz =   _to_int(get('sample_rate'))
+        self.bit_rate_bps =     _to_int(get('bit_rate'))
+        self.bit_rate_kbps = _to_kbps(self.bit_rate_bps)
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
@@ -1222,7 +2434,7 @@ class FFaudioStream(FFstream):
                         self.sample_rate_Hz, self.bit_rate_kbps)
 
 
-class FFsubtitleStream(FFstream):
+class FFsubtitleStream(FFstream, codec_type='subtitle'):
     """
     Class `FFsubtitleStream` is an individual subtitle stream in some media
     probed by ``ffprobe``.
@@ -1238,11 +2450,7 @@ class FFsubtitleStream(FFstream):
     Raises:
         FFprobeStreamSubclassError: ``(codec_type != "subtitle")``
     """
-    def __init__(self, parsed_json):
-        super().__init__(parsed_json)
-        if self.codec_type != 'subtitle':
-            raise FFprobeStreamSubclassError(
-                    type(self).__qualname__, self.codec_type, 'subtitle')
+    __slots__ = ()
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
@@ -1251,7 +2459,7 @@ class FFsubtitleStream(FFstream):
                         self.codec_type, self.codec_name)
 
 
-class FFvideoStream(FFstream):
+class FFvideoStream(FFstream, codec_type='video'):
     """
     Class `FFvideoStream` is an individual video stream in some media
     probed by ``ffprobe``.
@@ -1278,22 +2486,20 @@ class FFvideoStream(FFstream):
     Raises:
         FFprobeStreamSubclassError: ``(codec_type != "video")``
     """
-    def __init__(self, parsed_json):
-        super().__init__(parsed_json)
-        if self.codec_type != 'video':
-            raise FFprobeStreamSubclassError(
-                    type(self).__qualname__, self.codec_type, 'video')
-
-        self.width =            self.get_as_int('width')
-        self.height =           self.get_as_int('height')
-        self.avg_frame_rate =   self.get('avg_frame_rate')
-        self.r_frame_rate =     self.get('r_frame_rate')
-        self.num_frames =       self.get_as_int('nb_frames')
-        self.bit_rate_bps =     self.get_as_int('bit_rate')
-        try:
-            self.bit_rate_kbps = float(self.bit_rate_bps) / 1000.0
-        except (TypeError, ValueError):
-            self.bit_rate_kbps = None
+    __slots__ = ('width', 'height', 'avg_frame_rate', 'r_frame_rate',
+            'num_frames', 'bit_rate_bps', 'bit_rate_kbps')
+
+    def _init_attrs(self, parsed_json):
+        """Initialize the attributes of a new instance (after verification)."""
+        FFstream._init_attrs(self, parsed_json)
+        get = parsed_json.get
+        self.width =            _to_int(get('width'))
+        self.height =           _to_int(get('height'))
+        self.avg_frame_rate =   get('avg_frame_rate')
+        self.r_frame_rate =     get('r_frame_rate')
+        self.num_frames =       _to_int(get('nb_frames'))
+        self.bit_rate_bps =     _to_int(get('bit_rate'))
+        self.bit_rate_kbps = _to_kbps(self.bit_rate_bps)
 
     def __str__(self):
         """Return a string containing a human-readable summary of the object."""
@@ -1347,7 +2553,7 @@ class FFvideoStream(FFstream):
             frame_rate = self.parsed_json[key]
             # Possible exception: `frame_rate` doesn't match regex,
             # so `None` is returned, which has no method `.groups()`.
-            (n, d) = re.match("^(-?[0-9]+)/(-?[0-9]+)$", frame_rate).groups()
+            (n, d) = _FRAME_RATE_RATIO_MATCH(frame_rate).groups()
             # Possible exception: `int(n)` fails or `int(d)` fails.
             return (int(n), int(d))
         except Exception:
@@ -1471,23 +2677,20 @@ class FFvideoStream(FFstream):
                 (for example, if you would rather return a pair ``(None, None)``
                 than a single ``None`` value, for 2-tuple deconstruction).
         """
-        try:
-            return (int(self.width), int(self.height))
-        except Exception:
+        # The constructor has already converted `width` & `height` to `int`
+        # (or `None` if not found in the JSON), so no conversion is needed.
+        width = self.width
+        height = self.height
+        if width is None or height is None:
             return default
+        return (width, height)
 
 
-_KNOWN_FFSTREAM_SUBCLASSES = dict(
-    attachment= FFattachmentStream,
-    audio=      FFaudioStream,
-    subtitle=   FFsubtitleStream,
-    video=      FFvideoStream,
-)
-
 def _construct_ffstream_subclass(parsed_json):
+    """Construct the derived class of :class:`FFstream` for the "codec_type".
+
+    (Class :class:`FFprobe` performs this same lookup inline, for speed.)
+    """
     codec_type = parsed_json.get('codec_type')
-    if codec_type is not None:
-        constructor = _KNOWN_FFSTREAM_SUBCLASSES.get(codec_type)
-        if constructor is not None:
-            return constructor(parsed_json)
-    return FFstream(parsed_json)
+    return _KNOWN_FFSTREAM_SUBCLASSES.get(codec_type,
+            FFstream)._from_probe(parsed_json)
@@ -45,21 +45,26 @@ setup(
         # they're purely for use in searches by humans on PyPI.
         # So, we must specify all Python versions that are relevant.
         'Programming Language :: Python',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Programming Language :: Python :: 3 :: Only',
         'Topic :: Multimedia :: Sound/Audio',
         'Topic :: Multimedia :: Video',
     ],
     # Specify which Python versions we support.
     # This field WILL be checked & enforced by `pip_install`.
-    python_requires=">=3.3, <4",
+    python_requires=">=3.7, <4",
+    # Optional dependencies that are used automatically if installed.
+    # For example: `pip install ffprobe3py3[orjson]`
+    extras_require={
+        'orjson': ['orjson'],
+        'simdjson': ['pysimdjson'],
+        'ijson': ['ijson'],
+        'numpy': ['numpy'],
+    },
     # List additional URLs that are relevant to the project.
     # The dict keys are what's used to render the link text on PyPI.
     project_urls={
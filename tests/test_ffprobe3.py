@@ -16,12 +16,160 @@
 # If any tests fail, the script will halt immediately, with the error printed
 # to stderr.
 
+import json
 import os
 import re
+import shutil
+import types
+from collections.abc import Mapping
 
 _TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
 _DATA_DIR = os.path.join(_TESTS_DIR, "data")
 
+# Compiled once at import.  (Brackets are escaped rather than written as
+# character-classes like `[[]`, which `re` warns is a possible nested set.)
+_FFPROBE_REPR_MATCH = re.compile(
+        r"^FFprobe\(split_cmdline=\[.+\], parsed_json=\{.+\}\)$").match
+_FFPROBE_TRUNCATED_REPR_MATCH = re.compile(
+        r"^FFprobe\(split_cmdline=\[.+\], parsed_json=\{.{19}\.\.\.<[0-9]+ more chars>\)$").match
+_FFFORMAT_TRUNCATED_REPR_MATCH = re.compile(
+        r"^FFformat\(parsed_json=\{.{19}\.\.\.<[0-9]+ more chars>\)$").match
+
+# The keys that must be present in each parsed-JSON wrapper.
+# (Built once at import, rather than as a list literal on every test call.)
+_FFPROBE_KEYS = frozenset(['chapters', 'format', 'streams'])
+_FORMAT_KEYS = frozenset([
+        'bit_rate',
+        'duration',
+        'filename',
+        'format_long_name',
+        'format_name',
+        'nb_programs',
+        'nb_streams',
+        'probe_score',
+        'size',
+        'start_time',
+        'tags',
+])
+_VIDEO_STREAM_KEYS = frozenset([
+        'avg_frame_rate',
+        'bit_rate',
+        'bits_per_raw_sample',
+        'chroma_location',
+        'codec_long_name',
+        'codec_name',
+        'codec_tag',
+        'codec_tag_string',
+        'codec_time_base',
+        'codec_type',
+        'coded_height',
+        'coded_width',
+        'display_aspect_ratio',
+        'disposition',
+        'duration',
+        'duration_ts',
+        'has_b_frames',
+        'height',
+        'index',
+        'is_avc',
+        'level',
+        'nal_length_size',
+        'nb_frames',
+        'pix_fmt',
+        'profile',
+        'r_frame_rate',
+        'refs',
+        'sample_aspect_ratio',
+        'start_pts',
+        'start_time',
+        'tags',
+        'time_base',
+        'width',
+])
+_AUDIO_STREAM_KEYS = frozenset([
+        'nb_frames',
+        'r_frame_rate',
+        'channel_layout',
+        'start_pts',
+        'codec_long_name',
+        'tags',
+        'sample_fmt',
+        'duration',
+        'max_bit_rate',
+        'sample_rate',
+        'codec_type',
+        'duration_ts',
+        'disposition',
+        'codec_name',
+        'codec_time_base',
+        'bit_rate',
+        'time_base',
+        'codec_tag_string',
+        'avg_frame_rate',
+        'index',
+        'channels',
+        'start_time',
+        'profile',
+        'codec_tag',
+        'bits_per_sample',
+])
+
+# The exact (sorted) results expected from each `.list_attr_names()` method.
+_FFPROBE_ATTR_NAMES = (
+        'attachment',
+        'audio',
+        'chapters',
+        'executed_cmd',
+        'format',
+        'media_filename',
+        'parsed_json',
+        'split_cmdline',
+        'streams',
+        'subtitle',
+        'video',
+)
+_FORMAT_ATTR_NAMES = (
+        'bit_rate_bps',
+        'bit_rate_kbps',
+        'duration_human',
+        'duration_secs',
+        'format_long_name',
+        'format_name',
+        'num_streams',
+        'parsed_json',
+        'size_B',
+        'size_human',
+)
+_VIDEO_STREAM_ATTR_NAMES = (
+        'avg_frame_rate',
+        'bit_rate_bps',
+        'bit_rate_kbps',
+        'codec_long_name',
+        'codec_name',
+        'codec_type',
+        'duration_secs',
+        'height',
+        'index',
+        'num_frames',
+        'parsed_json',
+        'r_frame_rate',
+        'width',
+)
+_AUDIO_STREAM_ATTR_NAMES = (
+        'bit_rate_bps',
+        'bit_rate_kbps',
+        'channel_layout',
+        'codec_long_name',
+        'codec_name',
+        'codec_type',
+        'duration_secs',
+        'index',
+        'num_channels',
+        'num_frames',
+        'parsed_json',
+        'sample_rate_Hz',
+)
+
 # Yay for Python relative imports.  A very popular topic on Stack Overflow!
 _PARENT_DIR = os.path.dirname(_TESTS_DIR)
 import sys
@@ -39,31 +187,19 @@ def test_SampleVideo_720x480_5mb():
     p = ffprobe3.probe(test_filename)
 
     # `FFprobe` instance:
-    assert re.match("^FFprobe[(]split_cmdline=[[].+[]], parsed_json=[{].+[}][)]$", repr(p))
+    assert _FFPROBE_REPR_MATCH(repr(p))
     assert str(p) == ('FFprobe(ffprobe "%s" => (mov,mp4,m4a,3gp,3g2,mj2): 00:00:31.00, 5.2 MB, 1353.182 kb/s, 2 streams, 0 chapters)' % test_filename)
 
-    assert p.list_attr_names() == [
-            'attachment',
-            'audio',
-            'chapters',
-            'executed_cmd',
-            'format',
-            'media_filename',
-            'parsed_json',
-            'split_cmdline',
-            'streams',
-            'subtitle',
-            'video',
-    ]
+    assert p.list_attr_names() == list(_FFPROBE_ATTR_NAMES)
     # Test `.keys()` method & key-lookup `.__contains__()` method:
-    for k in ['chapters', 'format', 'streams']:
+    for k in _FFPROBE_KEYS:
         assert k in p.keys()
         assert k in p
 
     # Test key-yielding `.__iter__()` method:
-    for k in p:
-        assert p.get(k) is not None
-    assert sorted(p) == sorted(p.keys())
+    keys_iter = list(p)
+    assert all(p.get(k) is not None for k in keys_iter)
+    assert sorted(keys_iter) == sorted(p.keys())
 
     assert isinstance(p.split_cmdline, list)
     assert isinstance(p.executed_cmd, str)
@@ -96,44 +232,21 @@ def test_SampleVideo_720x480_5mb():
     assert str(f) == "FFformat((mov,mp4,m4a,3gp,3g2,mj2): 00:00:31.00, 5.2 MB, 1353.182 kb/s)"
 
     # Test `.keys()` method & key-lookup `.__contains__()` method:
-    for k in [
-            'bit_rate',
-            'duration',
-            'filename',
-            'format_long_name',
-            'format_name',
-            'nb_programs',
-            'nb_streams',
-            'probe_score',
-            'size',
-            'start_time',
-            'tags',
-    ]:
+    for k in _FORMAT_KEYS:
         assert k in f.keys()
         assert k in f
 
     # Test key-yielding `.__iter__()` method:
-    for k in f:
-        assert f.get(k) is not None
-    assert sorted(f) == sorted(f.keys())
+    keys_iter = list(f)
+    assert all(f.get(k) is not None for k in keys_iter)
+    assert sorted(keys_iter) == sorted(f.keys())
 
     assert f.get("format_name") == 'mov,mp4,m4a,3gp,3g2,mj2'
     assert f.get_as_float("duration") == 30.998
     assert f.get_as_int("nb_streams") == 2
     assert f.get_as_int('size') == 5243244
 
-    assert f.list_attr_names() == [
-            'bit_rate_bps',
-            'bit_rate_kbps',
-            'duration_human',
-            'duration_secs',
-            'format_long_name',
-            'format_name',
-            'num_streams',
-            'parsed_json',
-            'size_B',
-            'size_human',
-    ]
+    assert f.list_attr_names() == list(_FORMAT_ATTR_NAMES)
 
     assert f.bit_rate_bps == 1353182
     assert f.bit_rate_kbps == 1353.182
@@ -147,6 +260,11 @@ def test_SampleVideo_720x480_5mb():
 
     assert f.get_datasize_as_human('size') == '5.2 M'
     assert f.get_duration_as_human() == '00:00:31.00'
+    # Seconds that round up to a whole minute are carried into the minutes;
+    # otherwise the seconds are rounded exactly as by the `%05.2f` format.
+    assert ffprobe3.FFformat({'duration': '59.999'}).duration_human == '00:01:00.00'
+    assert ffprobe3.FFformat({'duration': '3599.999'}).duration_human == '01:00:00.00'
+    assert ffprobe3.FFformat({'duration': '823.935'}).duration_human == '00:13:43.93'
 
     # The streams:
     a = p.audio[0]
@@ -159,48 +277,14 @@ def test_SampleVideo_720x480_5mb():
     assert str(v) == "FFvideoStream(streams[0]: video(h264): 640x480, 25/1 fps, 966.247 kb/s)"
 
     # Test `.keys()` method & key-lookup `.__contains__()` method:
-    for k in [
-            'avg_frame_rate',
-            'bit_rate',
-            'bits_per_raw_sample',
-            'chroma_location',
-            'codec_long_name',
-            'codec_name',
-            'codec_tag',
-            'codec_tag_string',
-            'codec_time_base',
-            'codec_type',
-            'coded_height',
-            'coded_width',
-            'display_aspect_ratio',
-            'disposition',
-            'duration',
-            'duration_ts',
-            'has_b_frames',
-            'height',
-            'index',
-            'is_avc',
-            'level',
-            'nal_length_size',
-            'nb_frames',
-            'pix_fmt',
-            'profile',
-            'r_frame_rate',
-            'refs',
-            'sample_aspect_ratio',
-            'start_pts',
-            'start_time',
-            'tags',
-            'time_base',
-            'width',
-    ]:
+    for k in _VIDEO_STREAM_KEYS:
         assert k in v.keys()
         assert k in v
 
     # Test key-yielding `.__iter__()` method:
-    for k in v:
-        assert v.get(k) is not None
-    assert sorted(v) == sorted(v.keys())
+    keys_iter = list(v)
+    assert all(v.get(k) is not None for k in keys_iter)
+    assert sorted(keys_iter) == sorted(v.keys())
 
     assert v.get("codec_type") == 'video'
     assert v.get_as_float("duration") == 30.96
@@ -208,21 +292,7 @@ def test_SampleVideo_720x480_5mb():
     assert v.get_as_int("height") == 480
     assert v.get_as_int("width") == 640
 
-    assert v.list_attr_names() == [
-            'avg_frame_rate',
-            'bit_rate_bps',
-            'bit_rate_kbps',
-            'codec_long_name',
-            'codec_name',
-            'codec_type',
-            'duration_secs',
-            'height',
-            'index',
-            'num_frames',
-            'parsed_json',
-            'r_frame_rate',
-            'width',
-    ]
+    assert v.list_attr_names() == list(_VIDEO_STREAM_ATTR_NAMES)
 
     assert v.avg_frame_rate == '25/1'
     assert v.bit_rate_bps == 966247
@@ -255,40 +325,14 @@ def test_SampleVideo_720x480_5mb():
     assert str(a) == "FFaudioStream(streams[1]: audio(aac): 6 channels (5.1), 48000 Hz, 383.29 kb/s)"
 
     # Test `.keys()` method & key-lookup `.__contains__()` method:
-    for k in [
-            'nb_frames',
-            'r_frame_rate',
-            'channel_layout',
-            'start_pts',
-            'codec_long_name',
-            'tags',
-            'sample_fmt',
-            'duration',
-            'max_bit_rate',
-            'sample_rate',
-            'codec_type',
-            'duration_ts',
-            'disposition',
-            'codec_name',
-            'codec_time_base',
-            'bit_rate',
-            'time_base',
-            'codec_tag_string',
-            'avg_frame_rate',
-            'index',
-            'channels',
-            'start_time',
-            'profile',
-            'codec_tag',
-            'bits_per_sample',
-    ]:
+    for k in _AUDIO_STREAM_KEYS:
         assert k in a.keys()
         assert k in a
 
     # Test key-yielding `.__iter__()` method:
-    for k in a:
-        assert a.get(k) is not None
-    assert sorted(a) == sorted(a.keys())
+    keys_iter = list(a)
+    assert all(a.get(k) is not None for k in keys_iter)
+    assert sorted(keys_iter) == sorted(a.keys())
 
     assert a.get("codec_type") == 'audio'
     assert a.get_as_float("duration") == 30.997333
@@ -296,20 +340,7 @@ def test_SampleVideo_720x480_5mb():
     assert a.get_as_int("channels") == 6
     assert a.get_as_int("sample_rate") == 48000
 
-    assert a.list_attr_names() == [
-            'bit_rate_bps',
-            'bit_rate_kbps',
-            'channel_layout',
-            'codec_long_name',
-            'codec_name',
-            'codec_type',
-            'duration_secs',
-            'index',
-            'num_channels',
-            'num_frames',
-            'parsed_json',
-            'sample_rate_Hz',
-    ]
+    assert a.list_attr_names() == list(_AUDIO_STREAM_ATTR_NAMES)
 
     assert a.bit_rate_bps == 383290
     assert a.bit_rate_kbps == 383.29
@@ -330,6 +361,302 @@ def test_SampleVideo_720x480_5mb():
     assert not a.is_video()
 
 
+def test_repr_truncation():
+    test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+    p = ffprobe3.probe(test_filename)
+    full_repr = repr(p)
+    full_format_repr = repr(p.format)
+
+    ffprobe3.ParsedJson._repr_max_len = 20
+    try:
+        assert _FFPROBE_TRUNCATED_REPR_MATCH(repr(p))
+        assert _FFFORMAT_TRUNCATED_REPR_MATCH(repr(p.format))
+        assert len(repr(p)) < len(full_repr)
+    finally:
+        ffprobe3.ParsedJson._repr_max_len = None
+
+    assert repr(p) == full_repr
+    assert repr(p.format) == full_format_repr
+
+
+def test_slots():
+    test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+    p = ffprobe3.probe(test_filename)
+
+    # Every class declares its attributes in `__slots__`, so no instance
+    # should have a per-instance `__dict__`.
+    for obj in [p, p.format] + p.streams + p.chapters:
+        assert not hasattr(obj, '__dict__')
+
+
+def test_probe_cache():
+    test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+    ffprobe3.probe.cache_clear()
+    p1 = ffprobe3.probe(test_filename)
+    p2 = ffprobe3.probe(test_filename)
+
+    # The cached `ffprobe` output is re-parsed into a new, independent tree.
+    assert p1 is not p2
+    assert p1 == p2
+    assert p1.parsed_json is not p2.parsed_json
+    assert p1.format.parsed_json is not p2.format.parsed_json
+    assert str(p1) == str(p2)
+
+    # Whether stderr is captured does not affect the output.
+    p3 = ffprobe3.probe(test_filename, capture_stderr=False)
+    assert p3 == p1
+
+    # With `use_cache=False`, `ffprobe` is run & its output isn't cached.
+    from ffprobe3 import ffprobe3 as ffprobe3_actual
+    ffprobe3.probe.cache_clear()
+    p4 = ffprobe3.probe(test_filename, use_cache=False)
+    assert p4 == p1
+    assert ffprobe3_actual._run_ffprobe_cached.cache_info().currsize == 0
+    ffprobe3.probe.cache_clear()
+
+
+def test_probe_retain_json():
+    test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+    p1 = ffprobe3.probe(test_filename)
+    p2 = ffprobe3.probe(test_filename, retain_json=False)
+
+    # The data attributes are unaffected.
+    assert str(p2) == str(p1)
+    assert str(p2.format) == str(p1.format)
+    assert [str(s) for s in p2.streams] == [str(s) for s in p1.streams]
+    assert [str(v) for v in p2.video] == [str(v) for v in p1.video]
+    assert [str(a) for a in p2.audio] == [str(a) for a in p1.audio]
+    assert p2.chapters == p1.chapters == []
+
+    # But the parsed JSON has been discarded throughout the tree.
+    assert p2.parsed_json == {}
+    assert p2.format.parsed_json == {}
+    assert all(s.parsed_json == {} for s in p2.streams)
+    assert p2.video[0].get_as_int('width') is None
+
+    # The sample video has no chapters, so also test some JSON that does.
+    split_cmdline = ['ffprobe', 'movie.mkv']
+    chaptered_json = {
+            'chapters': [
+                    {'id': 0, 'start_time': '0.000000', 'end_time': '60.000000',
+                            'tags': {'title': 'Opening'}},
+                    {'id': 1, 'start_time': '60.000000', 'end_time': '120.000000',
+                            'tags': {'title': 'Ending'}},
+            ],
+            'format': {'format_name': 'matroska,webm', 'duration': '120.000000',
+                    'size': '1000000', 'bit_rate': '66666', 'nb_streams': 0},
+            'streams': [],
+    }
+    p1 = ffprobe3.FFprobe._from_probe(split_cmdline, chaptered_json)
+    p2 = ffprobe3.FFprobe._from_probe(split_cmdline, chaptered_json)
+    p2._discard_parsed_json()
+    assert p2.parsed_json == {}
+    assert str(p2) == str(p1)
+    assert str(p2).endswith(', 0 streams, 2 chapters)')
+    assert [c.title for c in p2.chapters] == ['Opening', 'Ending']
+    assert all(c.parsed_json == {} for c in p2.chapters)
+
+
+class _StubLazyJsonObject(Mapping):
+    """A minimal stand-in for a read-only, lazily-decoded ``simdjson.Object``.
+
+    This is used by :func:`test_probe_lazy_json` if the optional ``pysimdjson``
+    package is not installed, so the lazy-proxy code-path is always tested.
+    """
+    def __init__(self, decoded_dict):
+        self._decoded_dict = decoded_dict
+
+    def __getitem__(self, key):
+        return _stub_lazy_json_value(self._decoded_dict[key])
+
+    def __iter__(self):
+        return iter(self._decoded_dict)
+
+    def __len__(self):
+        return len(self._decoded_dict)
+
+    def as_dict(self):
+        return self._decoded_dict
+
+
+def _stub_lazy_json_value(value):
+    if isinstance(value, dict):
+        return _StubLazyJsonObject(value)
+    elif isinstance(value, list):
+        return [_stub_lazy_json_value(v) for v in value]
+    return value
+
+
+class _StubLazyJsonParser:
+    def parse(self, json_bytes):
+        return _stub_lazy_json_value(json.loads(json_bytes))
+
+
+def test_probe_lazy_json():
+    # If `pysimdjson` is not installed, `lazy_json` would simply be ignored;
+    # so temporarily replace it by a stub, to test the lazy-proxy code-path.
+    from ffprobe3 import ffprobe3 as ffprobe3_actual
+    real_simdjson = ffprobe3_actual.simdjson
+    if real_simdjson is None:
+        ffprobe3_actual.simdjson = types.SimpleNamespace(
+                Parser=_StubLazyJsonParser, Object=_StubLazyJsonObject)
+    try:
+        test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+        p1 = ffprobe3.probe(test_filename)
+        p2 = ffprobe3.probe(test_filename, lazy_json=True)
+    finally:
+        # Now restore the real (or missing) `simdjson` for any subsequent tests.
+        ffprobe3_actual.simdjson = real_simdjson
+
+    # The parsed JSON is lazy proxies, rather than `dict` instances.
+    assert type(p1.parsed_json) is dict
+    assert type(p2.parsed_json) is not dict
+    assert isinstance(p2.parsed_json, Mapping)
+    assert type(p2.format.parsed_json) is not dict
+    assert all(type(s.parsed_json) is not dict for s in p2.streams)
+
+    # But the proxies are materialized by `repr()` & compared by `==`.
+    assert repr(p2) == repr(p1)
+    assert repr(p2.format) == repr(p1.format)
+    assert _FFPROBE_REPR_MATCH(repr(p2))
+    assert p2 == p1
+    assert p2.format == p1.format
+    assert p2.streams == p1.streams
+
+    assert str(p2) == str(p1)
+    assert str(p2.format) == str(p1.format)
+    assert [str(s) for s in p2.streams] == [str(s) for s in p1.streams]
+    assert [str(v) for v in p2.video] == [str(v) for v in p1.video]
+    assert [str(a) for a in p2.audio] == [str(a) for a in p1.audio]
+    assert p2.chapters == p1.chapters == []
+
+    assert sorted(p2.keys()) == sorted(p1.keys())
+    assert p2.format.get("format_name") == p1.format.get("format_name")
+    assert p2.format.get_as_float("duration") == 30.998
+    assert p2.video[0].get_as_int("width") == 640
+    assert p2.video[0].get_frame_shape() == (640, 480)
+    assert p2.audio[0].get_as_int("sample_rate") == 48000
+
+
+def test_probe_many():
+    test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+    ps = ffprobe3.probe_many([test_filename] * 4, concurrency=2)
+    assert len(ps) == 4
+    assert all(isinstance(p, ffprobe3.FFprobe) for p in ps)
+    assert all(p == ffprobe3.probe(test_filename) for p in ps)
+
+    # The same keyword arguments as for `probe` are accepted
+    # (although the output is never cached by `probe_async` anyway).
+    ps = ffprobe3.probe_many([test_filename] * 2, use_cache=False)
+    assert all(p == ffprobe3.probe(test_filename) for p in ps)
+
+    # Exceptions are the same as for `probe`.
+    non_existent_media_filename = "this-media-file-does-not-exist"
+    try:
+        ffprobe3.probe_many([test_filename, non_existent_media_filename])
+    except ffprobe3.FFprobeMediaFileError as e:
+        assert e.file_path == non_existent_media_filename
+
+    # Or return each exception in place of the failed probe.
+    ps = ffprobe3.probe_many([test_filename, non_existent_media_filename],
+            return_exceptions=True)
+    assert isinstance(ps[0], ffprobe3.FFprobe)
+    assert isinstance(ps[1], ffprobe3.FFprobeMediaFileError)
+    assert ps[1].file_path == non_existent_media_filename
+
+    try:
+        ffprobe3.probe_many([test_filename], concurrency=0)
+    except ffprobe3.FFprobeInvalidArgumentError as e:
+        assert e.arg_name == 'concurrency'
+
+
+def test_probe_bulk():
+    test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+    columns = ffprobe3.probe_bulk([test_filename] * 3, concurrency=2)
+    assert sorted(columns.keys()) == sorted(['duration', 'bit_rate',
+            'width', 'height', 'nb_frames', 'sample_rate'])
+    assert all(len(column) == 3 for column in columns.values())
+
+    # The numbers are the same as the attributes of the `FFprobe` instance.
+    p = ffprobe3.probe(test_filename)
+    assert list(columns['duration']) == [p.format.duration_secs] * 3
+    assert list(columns['bit_rate']) == [p.format.bit_rate_bps] * 3
+    assert list(columns['width']) == [p.video[0].width] * 3
+    assert list(columns['height']) == [p.video[0].height] * 3
+    assert list(columns['nb_frames']) == [p.video[0].num_frames] * 3
+    assert list(columns['sample_rate']) == [p.audio[0].sample_rate_Hz] * 3
+
+    columns = ffprobe3.probe_bulk([])
+    assert all(len(column) == 0 for column in columns.values())
+
+    # The applicable keyword arguments of `probe` are accepted ...
+    columns = ffprobe3.probe_bulk([test_filename], communicate_timeout=20.0,
+            lazy_json=True, capture_stderr=False)
+    assert list(columns['width']) == [p.video[0].width]
+
+    # ... but not those that don't apply to `probe_bulk`.
+    try:
+        ffprobe3.probe_bulk([test_filename], retain_json=False)
+    except TypeError as e:
+        assert "probe_bulk() got an unexpected keyword argument 'retain_json'" in str(e)
+    else:
+        assert False, "expected TypeError"
+
+    # Exceptions are the same as for `probe_many`.
+    non_existent_media_filename = "this-media-file-does-not-exist"
+    try:
+        ffprobe3.probe_bulk([test_filename, non_existent_media_filename])
+    except ffprobe3.FFprobeMediaFileError as e:
+        assert e.file_path == non_existent_media_filename
+
+    try:
+        ffprobe3.probe_bulk([test_filename], concurrency=0)
+    except ffprobe3.FFprobeInvalidArgumentError as e:
+        assert e.arg_name == 'concurrency'
+
+
+def test_probe_input_bytes():
+    test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+    with open(test_filename, 'rb') as f:
+        media_bytes = f.read()
+    p = ffprobe3.probe(None, input_bytes=media_bytes)
+    assert p.media_filename == 'pipe:0'
+    assert p.split_cmdline[-1] == 'pipe:0'
+    assert p.format.format_name == 'mov,mp4,m4a,3gp,3g2,mj2'
+    assert len(p.video) == 1
+    assert len(p.audio) == 1
+
+    try:
+        ffprobe3.probe(test_filename, input_bytes=media_bytes)
+    except ffprobe3.FFprobeInvalidArgumentError as e:
+        assert e.arg_name == 'media_filename'
+
+
+def test_probe_streaming():
+    test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
+    p = ffprobe3.probe(test_filename)
+    streams = list(ffprobe3.probe_streaming(test_filename))
+    assert len(streams) == 2
+    assert isinstance(streams[0], ffprobe3.FFvideoStream)
+    assert isinstance(streams[1], ffprobe3.FFaudioStream)
+    assert streams == p.streams
+    assert [str(s) for s in streams] == [str(s) for s in p.streams]
+
+    # The output of `ffprobe` is never cached by this generator
+    # (whether or not the optional `ijson` package is installed).
+    from ffprobe3 import ffprobe3 as ffprobe3_actual
+    ffprobe3.probe.cache_clear()
+    list(ffprobe3.probe_streaming(test_filename))
+    list(ffprobe3.probe_streaming(test_filename))
+    assert ffprobe3_actual._run_ffprobe_cached.cache_info().currsize == 0
+
+    not_a_media_file = __file__
+    try:
+        list(ffprobe3.probe_streaming(not_a_media_file))
+    except ffprobe3.FFprobeSubprocessError as e:
+        assert e.exit_status == 1
+
+
 def test_errors():
     # Test handling of a non-existent local media file.
     non_existent_media_filename = "this-media-file-does-not-exist"
@@ -369,9 +696,23 @@ def test_errors():
         error_message = e.stderr.split(':', 1)[-1].strip()
         assert error_message == 'Invalid data found when processing input'
 
+    # The same error message is reported when stderr is not captured
+    # (because `ffprobe` is re-run, capturing stderr, after it fails).
+    try:
+        ffprobe3.probe(not_a_media_file, capture_stderr=False)
+    except ffprobe3.FFprobeSubprocessError as e:
+        # This is the exception that was expected.
+        assert e.exit_status == 1
+        error_message = e.stderr.split(':', 1)[-1].strip()
+        assert error_message == 'Invalid data found when processing input'
+
     # Test handling of a non-existent command specified by the caller.
     test_filename = os.path.join(_DATA_DIR, "SampleVideo_720x480_5mb.mp4")
     non_existent_command_name = "this-command-does-not-exist"
+    # Both tests below rely upon this command really not existing anywhere.
+    # (The override is rejected by `os.path.isfile` before anything is run;
+    # the `$PATH` test costs one failed `execve`, which is what it tests.)
+    assert shutil.which(non_existent_command_name) is None
     try:
         ffprobe3.probe(test_filename,
                 ffprobe_cmd_override=non_existent_command_name)
@@ -383,20 +724,31 @@ def test_errors():
     # We will do this by temporarily replacing the normally-valid `"ffprobe"`
     # command with `"this-command-does-not-exist"`.
     from ffprobe3 import ffprobe3 as ffprobe3_actual
-    # Save the valid ffprobe command so we can restore it after the test.
-    valid_ffprobe_command = ffprobe3_actual._SPLIT_COMMAND_LINE[0]
-    ffprobe3_actual._SPLIT_COMMAND_LINE[0] = non_existent_command_name
+    # Save the valid ffprobe command-line so we can restore it after the test.
+    # (The command-line is an immutable tuple, so we replace the whole tuple.)
+    valid_split_cmdline = ffprobe3_actual._SPLIT_COMMAND_LINE
+    ffprobe3_actual._SPLIT_COMMAND_LINE = \
+            (non_existent_command_name,) + valid_split_cmdline[1:]
     try:
         ffprobe3.probe(test_filename)
     except ffprobe3.FFprobeExecutableError as e:
         # This is the exception that was expected.
         assert e.cmd == non_existent_command_name
-    # Now restore the valid ffprobe command for any subsequent tests.
-    ffprobe3_actual._SPLIT_COMMAND_LINE[0] = valid_ffprobe_command
+    # Now restore the valid ffprobe command-line for any subsequent tests.
+    ffprobe3_actual._SPLIT_COMMAND_LINE = valid_split_cmdline
 
 
 _TEST_FUNCS = [
         test_SampleVideo_720x480_5mb,
+        test_repr_truncation,
+        test_slots,
+        test_probe_cache,
+        test_probe_retain_json,
+        test_probe_lazy_json,
+        test_probe_many,
+        test_probe_bulk,
+        test_probe_input_bytes,
+        test_probe_streaming,
         test_errors,
 ]
 